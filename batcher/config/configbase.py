@@ -5,17 +5,19 @@
 
 Configuration entries can also be made dynamic, i.e. resolve dynamically at
 the time of accessing the entry, by wrapping the entry in a function accepting
-no parameters and returning a single value. For example, suppose that a
-``translate`` function takes an input string and returns a translated version
-of the string. You can then assign an entry as follows:
+no parameters and returning a single value. Dynamic entries are useful when you
+need to keep some entries up-to-date when they depend on the value of other
+entries, which may be modified. For example:
 
-  config.PLUGIN_TITLE = lambda: translate('Batcher')
+  config.LOCALE_DIRPATH = lambda: os.path.join(config.PLUGIN_DIRPATH, 'locale')
+
+Every time you access `config.LOCALE_DIRPATH`, the path will be computed from
+the current value of `config.PLUGIN_DIRPATH`.
 
-Every time you access `config.PLUGIN_TITLE`, the input string will be processed
-and the output will be a translated version of the string.
+Entries that do not depend on other entries, such as translated strings, should
+be assigned directly as they are then computed only once, e.g.:
 
-Dynamic entries are also useful when you need to keep some entries up-to-date
-when they depend on the value of other entries, which may be modified.
+  config.PLUGIN_TITLE = _('Batcher')
 
 The following configuration entries are provided by default:
 
@@ -10,9 +10,12 @@
 utils.initialize_i18n()
 
 import argparse
+import concurrent.futures
+import functools
 import pathlib
 import re
 import shutil
+import stat
 import subprocess
 import tempfile
 import zipfile
@@ -21,8 +24,6 @@
 import pathspec
 
 from config import CONFIG
-from dev import create_user_docs
-from dev import process_local_docs
 from src import constants
 
 
@@ -45,6 +46,13 @@
 README_RELATIVE_FILEPATH = os.path.join('documentation', 'index.html')
 README_RELATIVE_OUTPUT_FILEPATH = 'Readme.html'
 
+# Fixed modification time for ZIP archive entries, making archives reproducible.
+ZIP_ARCHIVE_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ZIP_ARCHIVE_COPY_BUFFER_SIZE = 1024 * 1024
+ZIP_ARCHIVE_FILE_PERMISSIONS = 0o755
+
+_GITATTRIBUTES_FILTER_PATTERN = re.compile(r'^[ \t]*(.*?)[ \t]+filter=', flags=re.MULTILINE)
+
 
 def main():
   parser = argparse.ArgumentParser(description='Create installers for the GIMP plug-in.')
@@ -105,23 +113,18 @@ def make_installers(
   if generate_docs:
     _create_user_docs(os.path.join(temp_dirpath, CONFIG.PLUGIN_NAME))
   
-  input_filepaths = _get_filtered_filepaths(input_dirpath, INCLUDE_LIST_FILEPATH)
-  user_docs_filepaths = _get_filtered_filepaths(temp_dirpath, INCLUDE_LIST_FILEPATH)
-  
-  relative_filepaths = (
-    _get_relative_filepaths(input_filepaths, input_dirpath)
-    + _get_relative_filepaths(user_docs_filepaths, temp_dirpath))
+  include_spec_obj = _get_path_spec(INCLUDE_LIST_FILEPATH)
   
-  temp_filepaths = [
-    os.path.join(temp_dirpath, relative_filepath)
-    for relative_filepath in relative_filepaths]
+  input_filepaths = []
+  relative_filepaths = []
   
-  _copy_files_to_temp_filepaths(input_filepaths, temp_filepaths)
-  
-  _set_permissions(temp_dirpath, 0o755)
+  for root_dirpath in [input_dirpath, temp_dirpath]:
+    for filepath, relative_filepath in _get_filtered_filepaths(root_dirpath, include_spec_obj):
+      input_filepaths.append(filepath)
+      relative_filepaths.append(relative_filepath)
   
   _create_installers(
-    installer_dirpath, temp_dirpath, temp_filepaths, relative_filepaths, installers)
+    installer_dirpath, temp_dirpath, input_filepaths, relative_filepaths, installers)
   
   _restore_repo_files(
     temp_repo_files_dirpath, input_dirpath, relative_filepaths_with_git_filters)
@@ -143,18 +146,15 @@ def _prepare_repo_files_for_packaging(
       repository_dirpath, dirpath_with_original_files_with_git_filters, force_if_dirty):
   repo = git.Repo(repository_dirpath)
   
-  if not force_if_dirty and repo.git.status('--porcelain'):
+  if not force_if_dirty and _has_local_changes(repository_dirpath):
     print('Repository contains local changes. Please remove or commit changes before proceeding.',
           file=sys.stderr)
     exit(1)
   
   path_specs = _get_path_specs_with_git_filters_from_gitattributes(repository_dirpath)
   
-  spec_obj = pathspec.PathSpec.from_lines(
-    pathspec.patterns.gitwildmatch.GitWildMatchPattern, path_specs)
-  
-  relative_filepaths_with_git_filters = [
-    match for match in spec_obj.match_tree(repository_dirpath)]
+  relative_filepaths_with_git_filters = _get_relative_filepaths_matching_path_specs(
+    repository_dirpath, path_specs)
   
   _move_files_with_filters_to_temporary_location(
     repository_dirpath,
@@ -166,23 +166,38 @@ def _prepare_repo_files_for_packaging(
   return relative_filepaths_with_git_filters
 
 
+def _has_local_changes(repository_dirpath):
+  # Only the presence of output matters, hence the output is not decoded.
+  completed_process = subprocess.run(
+    ['git', '-C', repository_dirpath, 'status', '--porcelain', '-z'],
+    stdout=subprocess.PIPE,
+    check=True)
+  
+  return bool(completed_process.stdout)
+
+
 def _move_files_with_filters_to_temporary_location(
       repository_dirpath,
       relative_filepaths_with_git_filters,
       dirpath_with_original_files_with_git_filters):
+  created_dirpaths = set()
+  
   for relative_filepath in relative_filepaths_with_git_filters:
     src_filepath = os.path.join(repository_dirpath, relative_filepath)
     dest_filepath = os.path.join(
       dirpath_with_original_files_with_git_filters, relative_filepath)
     
-    os.makedirs(os.path.dirname(dest_filepath), exist_ok=True)
-    shutil.copy(src_filepath, dest_filepath)
-    os.remove(src_filepath)
+    dest_dirpath = os.path.dirname(dest_filepath)
+    if dest_dirpath not in created_dirpaths:
+      os.makedirs(dest_dirpath, exist_ok=True)
+      created_dirpaths.add(dest_dirpath)
+    
+    shutil.move(src_filepath, dest_filepath)
 
 
 def _reset_files_with_filters_and_activate_smudge_filters(repo, path_specs):
-  for path_spec in path_specs:
-    repo.git.checkout(path_spec)
+  if path_specs:
+    repo.git.checkout('--', *path_specs)
 
 
 def _restore_repo_files(
@@ -190,75 +205,95 @@ def _restore_repo_files(
       repository_dirpath,
       relative_filepaths_with_git_filters):
   for relative_filepath in relative_filepaths_with_git_filters:
-    shutil.copy(
+    shutil.copyfile(
       os.path.join(dirpath_with_original_files_with_git_filters, relative_filepath),
       os.path.join(repository_dirpath, relative_filepath))
 
 
 def _get_path_specs_with_git_filters_from_gitattributes(repository_dirpath):
-  path_specs = []
   gitattributes_filepath = os.path.join(repository_dirpath, '.gitattributes')
   
-  with open(gitattributes_filepath, 'r', encoding=constants.TEXT_FILE_ENCODING) as f:
-    for line in f:
-      match = re.search(r'\s*(.*?)\s+filter=', line)
-      if match:
-        path_specs.append(match.group(1))
+  with open(gitattributes_filepath, 'rb') as f:
+    gitattributes_contents = f.read().decode(constants.TEXT_FILE_ENCODING)
+  
+  return [
+    match.group(1) for match in _GITATTRIBUTES_FILTER_PATTERN.finditer(gitattributes_contents)]
+
+
+@functools.lru_cache
+def _get_path_spec(pattern_filepath):
+  with open(pattern_filepath, 'rb') as f:
+    lines = f.read().decode(constants.TEXT_FILE_ENCODING).splitlines()
   
-  return path_specs
+  return pathspec.PathSpec.from_lines(pathspec.patterns.gitwildmatch.GitWildMatchPattern, lines)
 
 
-def _get_filtered_filepaths(dirpath, pattern_filepath):
-  with open(pattern_filepath, 'r', encoding=constants.TEXT_FILE_ENCODING) as f:
-    spec_obj = pathspec.PathSpec.from_lines(
-      pathspec.patterns.gitwildmatch.GitWildMatchPattern, f)
+def _get_relative_filepaths_matching_path_specs(repository_dirpath, path_specs):
+  """Returns paths relative to ``repository_dirpath`` of files matching the
+  specified gitwildmatch path specs.
+  
+  The path specs are combined into a single `pathspec.PathSpec` so that each
+  file is matched only once. The ``.git`` directory is skipped.
+  """
+  spec_obj = pathspec.PathSpec.from_lines(
+    pathspec.patterns.gitwildmatch.GitWildMatchPattern, path_specs)
+  
+  relative_filepaths = []
   
-  return [os.path.join(dirpath, match) for match in spec_obj.match_tree(dirpath)]
+  for entry in _scandir_files_recursive(repository_dirpath, excluded_dirnames=['.git']):
+    relative_filepath = os.path.relpath(entry.path, repository_dirpath)
+    if spec_obj.match_file(relative_filepath):
+      relative_filepaths.append(relative_filepath)
+  
+  return relative_filepaths
 
 
-def _get_relative_filepaths(filepaths, root_dirpath):
-  return [filepath[len(root_dirpath) + 1:] for filepath in filepaths]
+def _get_filtered_filepaths(dirpath, spec_obj):
+  """Yields (file path, file path relative to ``dirpath``) pairs for files
+  within ``dirpath`` matching ``spec_obj``.
+  """
+  for relative_filepath in spec_obj.match_tree(dirpath):
+    yield os.path.join(dirpath, relative_filepath), relative_filepath
 
 
 def _compile_translation_files(source_dirpath):
-  orig_cwd = os.getcwd()
-  os.chdir(source_dirpath)
-  
-  for root_dirpath, _unused, filenames in os.walk(source_dirpath):
-    for filename in filenames:
-      if os.path.isfile(os.path.join(root_dirpath, filename)) and filename.endswith('.po'):
-        po_file = os.path.join(root_dirpath, filename)
-        language = pathlib.Path(root_dirpath).parts[-2]
-        subprocess.call(['./generate_mo.sh', po_file, language])
+  po_files_and_languages = [
+    (entry.path, pathlib.Path(entry.path).parts[-3])
+    for entry in _scandir_files_recursive(source_dirpath)
+    if entry.name.endswith('.po')]
   
-  os.chdir(orig_cwd)
+  def _compile_translation_file(po_file_and_language):
+    po_file, language = po_file_and_language
+    subprocess.run(['./generate_mo.sh', po_file, language], cwd=source_dirpath, check=True)
 
+  # Consuming the results re-raises the first failure, which stops the build.
+  with concurrent.futures.ThreadPoolExecutor() as executor:
+    list(executor.map(_compile_translation_file, po_files_and_languages))
 
-def _copy_files_to_temp_filepaths(filepaths, temp_filepaths):
-  for src_filepath, temp_filepath in zip(filepaths, temp_filepaths):
-    dirpath = os.path.dirname(temp_filepath)
-    if not os.path.exists(dirpath):
-      os.makedirs(dirpath, exist_ok=True)
-    shutil.copy(src_filepath, temp_filepath)
+
+def _scandir_files_recursive(dirpath, excluded_dirnames=()):
+  dirpaths = [dirpath]
+  
+  while dirpaths:
+    with os.scandir(dirpaths.pop()) as entries:
+      for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+          if entry.name not in excluded_dirnames:
+            dirpaths.append(entry.path)
+        elif entry.is_file():
+          yield entry
 
 
 def _create_user_docs(dirpath):
+  # Documentation modules are imported only when needed as they are not
+  # required if no documentation is generated.
+  from dev import create_user_docs
+  
   create_user_docs.main(GITHUB_PAGE_DIRPATH, dirpath)
 
 
-def _set_permissions(dirpath, permissions):
-  """Sets file permissions for all files and subdirectories in the given
-  directory path.
-  """
-  for root, dirnames, filenames in os.walk(dirpath):
-    for dirname in dirnames:
-      os.chmod(os.path.join(root, dirname), permissions)
-    for filename in filenames:
-      os.chmod(os.path.join(root, filename), permissions)
-
-
 def _create_installers(
-      installer_dirpath, input_dirpath, input_filepaths, output_filepaths, installers):
+      installer_dirpath, temp_dirpath, input_filepaths, output_filepaths, installers):
   if installers is None:
     installers = []
   
@@ -276,25 +311,30 @@ def _create_installers(
       if installer in installer_funcs]
   
   for installer_func in installer_funcs_to_invoke:
-    installer_func(installer_dirpath, input_dirpath, input_filepaths, output_filepaths)
+    installer_func(installer_dirpath, temp_dirpath, input_filepaths, output_filepaths)
 
 
 def _create_zip_archive(
-      installer_dirpath, input_dirpath, input_filepaths, output_filepaths):
-  archive_filename = f'{CONFIG.PLUGIN_NAME}-{CONFIG.PLUGIN_VERSION}.zip'
+      installer_dirpath, temp_dirpath, input_filepaths, output_filepaths):
+  plugin_name = CONFIG.PLUGIN_NAME
+  
+  archive_filename = f'{plugin_name}-{CONFIG.PLUGIN_VERSION}.zip'
   archive_filepath = os.path.join(installer_dirpath, archive_filename)
   
-  readme_filepath = os.path.join(input_dirpath, CONFIG.PLUGIN_NAME, README_RELATIVE_FILEPATH)
+  readme_filepath = os.path.join(temp_dirpath, plugin_name, README_RELATIVE_FILEPATH)
   
   can_create_toplevel_readme = readme_filepath in input_filepaths
   
   if can_create_toplevel_readme:
-    input_filepaths.append(_create_toplevel_readme_for_zip_archive(readme_filepath))
+    input_filepaths.append(
+      _create_toplevel_readme_for_zip_archive(readme_filepath, set(output_filepaths)))
     output_filepaths.append(README_RELATIVE_OUTPUT_FILEPATH)
   
-  with zipfile.ZipFile(archive_filepath, 'w', zipfile.ZIP_STORED) as archive_file:
-    for input_filepath, output_filepath in zip(input_filepaths, output_filepaths):
-      archive_file.write(input_filepath, output_filepath)
+  with zipfile.ZipFile(
+        archive_filepath, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as archive_file:
+    for input_filepath, output_filepath in sorted(
+          zip(input_filepaths, output_filepaths), key=lambda item: item[1]):
+      _write_file_to_zip_archive(archive_file, input_filepath, output_filepath)
   
   print('ZIP archive successfully created:', archive_filepath)
   
@@ -303,10 +343,26 @@ def _create_zip_archive(
     output_filepaths.pop()
 
 
-def _create_toplevel_readme_for_zip_archive(readme_filepath):
+def _write_file_to_zip_archive(archive_file, input_filepath, output_filepath):
+  zip_info = zipfile.ZipInfo.from_file(input_filepath, output_filepath)
+  zip_info.date_time = ZIP_ARCHIVE_ENTRY_DATE_TIME
+  zip_info.external_attr = (stat.S_IFREG | ZIP_ARCHIVE_FILE_PERMISSIONS) << 16
+  zip_info.compress_type = zipfile.ZIP_DEFLATED
+  
+  with open(input_filepath, 'rb') as input_file:
+    with archive_file.open(zip_info, 'w') as output_file:
+      shutil.copyfileobj(input_file, output_file, ZIP_ARCHIVE_COPY_BUFFER_SIZE)
+
+
+def _create_toplevel_readme_for_zip_archive(readme_filepath, archived_relative_filepaths):
+  from dev import create_user_docs
+  from dev import process_local_docs
+  
+  readme_dirpath = os.path.dirname(readme_filepath)
+  
   def _modify_relative_paths(url_attribute_value):
     url_filepath_and_anchor = (
-      os.path.join(os.path.dirname(readme_filepath), url_attribute_value).rsplit('#', maxsplit=1))
+      os.path.join(readme_dirpath, url_attribute_value).rsplit('#', maxsplit=1))
 
     if len(url_filepath_and_anchor) == 1:
       url_filepath = url_filepath_and_anchor[0]
@@ -315,12 +371,15 @@ def _modify_relative_paths(url_attribute_value):
       url_filepath = url_filepath_and_anchor[0]
       anchor = f'#{url_filepath_and_anchor[1]}'
 
-    if not os.path.exists(url_filepath):
-      return url_attribute_value
-
     new_url_attribute_value = os.path.relpath(
       os.path.normpath(url_filepath), TEMP_INPUT_DIRPATH)
 
+    # Files outside the generated documentation are not copied to
+    # `TEMP_INPUT_DIRPATH`, hence we also check the files to be archived.
+    if (not os.path.exists(url_filepath)
+        and new_url_attribute_value not in archived_relative_filepaths):
+      return url_attribute_value
+
     new_url_attribute_value = pathlib.Path(new_url_attribute_value).as_posix()
 
     return f'{new_url_attribute_value}{anchor}'
@@ -328,8 +387,6 @@ def _modify_relative_paths(url_attribute_value):
   toplevel_readme_filepath = os.path.join(
     TEMP_INPUT_DIRPATH, os.path.basename(readme_filepath))
   
-  shutil.copy(readme_filepath, toplevel_readme_filepath)
-  
   process_local_docs.modify_url_attributes_in_file(
     readme_filepath,
     _modify_relative_paths,
@@ -4,22 +4,19 @@
 
 import ast
 import argparse
+import concurrent.futures
 import getpass
-import inspect
-import json
 import os
 import re
-import requests
 import signal
 import shutil
 import subprocess
 import sys
 import time
-import traceback
 
 import git
 
-DEV_DIRPATH = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+DEV_DIRPATH = os.path.dirname(os.path.abspath(__file__))
 PLUGIN_DIRPATH = os.path.dirname(DEV_DIRPATH)
 ROOT_DIRPATH = os.path.dirname(PLUGIN_DIRPATH)
 
@@ -60,6 +57,10 @@
 
 PYTHON_MODULE_TAB_WIDTH = 2
 
+_CHANGELOG_HEADER_PATTERN = re.compile(r'(##? (.*?)\n|(.*?)\n[=-]+\n)')
+_CHANGELOG_HASH_HEADER_PATTERN = re.compile(r'##? .*?\n')
+_CHANGELOG_UNDERLINED_HEADER_PATTERN = re.compile(r'.*?\n[=-]+\n')
+
 
 def main():
   parsed_args = parse_args(sys.argv[1:])
@@ -74,7 +75,7 @@ def make_release(**kwargs):
     repo,
     gh_pages_repo,
     current_version=CONFIG.PLUGIN_VERSION,
-    released_versions=repo.git.tag('-l').strip('\n').split('\n'),
+    released_versions=frozenset(tag.name for tag in repo.tags),
     username=CONFIG.REPOSITORY_USERNAME,
     remote_repo_name=CONFIG.REPOSITORY_NAME,
     **kwargs)
@@ -89,6 +90,8 @@ def handle_sigint(_signal, _frame):
   try:
     _make_release(release_metadata)
   except Exception:
+    import traceback
+    
     _print_error(
       (f'\nThe following error has occurred:\n{traceback.format_exc()}'
        '\nPerforming rollback and terminating.'))
@@ -143,23 +146,41 @@ def _make_release(release_metadata):
 
 
 def _check_branches_for_local_changes(release_metadata):
-  if not release_metadata.force and _has_active_branch_local_changes(release_metadata.repo):
+  if release_metadata.force:
+    return
+  
+  # Both checks spend most of the time waiting for `git`, hence they can run
+  # concurrently.
+  with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+    repo_future = executor.submit(_has_active_branch_local_changes, release_metadata.repo)
+    gh_pages_repo_future = executor.submit(
+      _has_active_branch_local_changes, release_metadata.gh_pages_repo)
+  
+  if repo_future.result():
     _print_error_and_exit(
       'Repository contains local changes. Please remove or commit changes before proceeding.')
   
-  if (not release_metadata.force
-      and _has_active_branch_local_changes(release_metadata.gh_pages_repo)):
+  if gh_pages_repo_future.result():
     _print_error_and_exit(
       (f'Repository in the "{release_metadata.gh_pages_repo.active_branch.name}" branch'
        ' contains local changes. Please remove or commit changes before proceeding.'))
 
 
 def _has_active_branch_local_changes(repo):
-  return bool(repo.git.status('--porcelain'))
+  env = {'GIT_OPTIONAL_LOCKS': '0'}
+  
+  # `git diff --quiet` stops at the first change instead of listing all changes.
+  try:
+    repo.git.diff('--quiet', 'HEAD', '--', env=env)
+  except git.GitCommandError:
+    return True
+  
+  # Untracked files would be committed by the release as well.
+  return bool(repo.git.ls_files('--others', '--exclude-standard', env=env))
 
 
 def _check_if_tag_with_new_version_already_exists(release_metadata):
-  if release_metadata.repo.git.tag('-l', release_metadata.new_version):
+  if release_metadata.new_version in release_metadata.released_versions:
     _print_error_and_exit(
       (f'Repository already contains tag "{release_metadata.new_version}", indicating that'
        ' such a version is already released.'))
@@ -206,13 +227,14 @@ def _should_proceed_based_on_yes_no_prompt(prompt):
 
 def _get_release_notes_and_modify_changelog_first_header(release_metadata):
   with open(CHANGELOG_FILEPATH, 'r', encoding=constants.TEXT_FILE_ENCODING) as f:
-    changelog_contents = f.read()
+    orig_changelog_contents = f.read()
+  
+  changelog_contents = orig_changelog_contents
   
   header_raw, release_notes = (
     preprocess_document_contents.find_section(changelog_contents))
   
-  header_pattern = r'(##? (.*?)\n|(.*?)\n[=-]+\n)'
-  match = re.search(header_pattern, header_raw)
+  match = _CHANGELOG_HEADER_PATTERN.search(header_raw)
   if (match
       and all(header not in release_metadata.released_versions
               for header in [match.group(2), match.group(3)])):
@@ -230,22 +252,27 @@ def _get_release_notes_and_modify_changelog_first_header(release_metadata):
     else:
       new_release_date_str = ''
     
+    new_version = release_metadata.new_version
+    
     if match.group(2):
-      changelog_contents = re.sub(
-        r'##? .*?\n', r'## ' + release_metadata.new_version + r'\n' + new_release_date_str,
-        changelog_contents,
-        count=1)
+      header_match = _CHANGELOG_HASH_HEADER_PATTERN.search(changelog_contents)
+      new_header = f'## {new_version}\n{new_release_date_str}'
     elif match.group(3):
-      changelog_contents = re.sub(
-        r'.*?\n[=-]+\n',
-        (release_metadata.new_version
-         + r'\n'
-         + '-' * len(release_metadata.new_version)
-         + r'\n'
-         + new_release_date_str),
-        changelog_contents,
-        count=1)
-  
+      header_match = _CHANGELOG_UNDERLINED_HEADER_PATTERN.search(changelog_contents)
+      new_header = f'{new_version}\n{"-" * len(new_version)}\n{new_release_date_str}'
+    else:
+      header_match = None
+      new_header = None
+    
+    if header_match:
+      changelog_contents = (
+        changelog_contents[:header_match.start()]
+        + new_header
+        + changelog_contents[header_match.end():])
+    
+    if changelog_contents == orig_changelog_contents:
+      return
+    
     with open(CHANGELOG_FILEPATH, 'w', encoding=constants.TEXT_FILE_ENCODING) as f:
       f.write(changelog_contents)
 
@@ -265,29 +292,38 @@ def _update_version_and_release_date_in_config(release_metadata, plugin_config_f
   if release_metadata.dry_run:
     return
   
-  with open(plugin_config_filepath, 'r', encoding=constants.TEXT_FILE_ENCODING) as f:
-    lines = f.readlines()
-  
-  def get_entry_pattern(entry):
-    return r'^( *config\.' + re.escape(entry) + " = )'(.*)'$"
+  entry_patterns = {
+    entry_name: re.compile(r'^( *config\.' + re.escape(entry_name) + " = )'(.*)'$")
+    for entry_name in entries_to_modify}
   
   entries_to_find = dict(entries_to_modify)
+  lines = []
+  is_modified = False
   
-  for i, line in enumerate(lines):
-    for entry_name, new_entry_value in list(entries_to_find.items()):
-      if re.search(get_entry_pattern(entry_name), line):
-        lines[i] = re.sub(
-          get_entry_pattern(entry_name), r"\1'" + new_entry_value + "'", line)
-        del entries_to_find[entry_name]
-    
-    if not entries_to_find:
-      break
+  with open(plugin_config_filepath, 'r', encoding=constants.TEXT_FILE_ENCODING) as f:
+    for line in f:
+      for entry_name, new_entry_value in list(entries_to_find.items()):
+        if entry_patterns[entry_name].search(line):
+          new_line = entry_patterns[entry_name].sub(r"\1'" + new_entry_value + "'", line)
+          is_modified = is_modified or new_line != line
+          line = new_line
+          del entries_to_find[entry_name]
+      
+      lines.append(line)
+      
+      if not entries_to_find:
+        # The remaining lines are kept as is without searching for entries.
+        lines.extend(f)
+        break
   
   if entries_to_find:
     _print_error_and_exit(
       (f'Error: missing the following entries in file "{plugin_config_filepath}":'
        f' {", ".join(entries_to_find)}'))
   
+  if not is_modified:
+    return
+  
   with open(plugin_config_filepath, 'w', encoding=constants.TEXT_FILE_ENCODING) as f:
     f.writelines(lines)
 
@@ -440,18 +476,15 @@ def _generate_translation_file(release_metadata):
   if release_metadata.dry_run and not release_metadata.force_make_output:
     return
   
-  orig_cwd = os.getcwd()
-  os.chdir(os.path.join(PLUGIN_DIRPATH, 'locale'))
-  
-  subprocess.call([
-    './generate_pot.sh',
-    CONFIG.PLUGIN_NAME,
-    release_metadata.new_version,
-    CONFIG.DOMAIN_NAME,
-    CONFIG.AUTHOR_NAME,
-  ])
-  
-  os.chdir(orig_cwd)
+  subprocess.call(
+    [
+      './generate_pot.sh',
+      CONFIG.PLUGIN_NAME,
+      release_metadata.new_version,
+      CONFIG.DOMAIN_NAME,
+      CONFIG.AUTHOR_NAME,
+    ],
+    cwd=os.path.join(PLUGIN_DIRPATH, 'locale'))
 
 
 def _create_release_commit(release_metadata, repo):
@@ -461,11 +494,9 @@ def _create_release_commit(release_metadata, repo):
     return
   
   repo.git.add('--all')
-  repo.git.commit('-m', _get_release_message_header(release_metadata))
-  
-  # Amend the commit as git hooks may have modified additional files.
-  repo.git.add('--all')
-  repo.git.commit('--amend', '--no-edit')
+  # Files staged by the pre-commit hook are included in the commit as git
+  # re-reads the index after running the hook.
+  repo.git.commit('-m', release_metadata.release_message_header)
 
 
 def _create_release_tag(release_metadata):
@@ -478,11 +509,7 @@ def _create_release_tag(release_metadata):
     '-a',
     release_metadata.new_version,
     '-m',
-    _get_release_message_header(release_metadata))
-
-
-def _get_release_message_header(release_metadata):
-  return f'Release {release_metadata.new_version}'
+    release_metadata.release_message_header)
 
 
 def _prepare_gh_pages_for_update(release_metadata):
@@ -491,16 +518,16 @@ def _prepare_gh_pages_for_update(release_metadata):
   if release_metadata.dry_run:
     return
 
-  for filename in os.listdir(os.path.join(GITHUB_PAGES_DIRPATH, 'dev')):
-    if os.path.isdir(os.path.join(GITHUB_PAGES_DIRPATH, filename)):
-      shutil.rmtree(os.path.join(GITHUB_PAGES_DIRPATH, filename))
-      shutil.copytree(
-        os.path.join(GITHUB_PAGES_DIRPATH, 'dev', filename),
-        os.path.join(GITHUB_PAGES_DIRPATH, filename))
-    else:
-      shutil.copy(
-        os.path.join(GITHUB_PAGES_DIRPATH, 'dev', filename),
-        os.path.join(GITHUB_PAGES_DIRPATH, filename))
+  with os.scandir(os.path.join(GITHUB_PAGES_DIRPATH, 'dev')) as entries:
+    for entry in entries:
+      dest_path = os.path.join(GITHUB_PAGES_DIRPATH, entry.name)
+      
+      if entry.is_dir(follow_symlinks=False):
+        if os.path.isdir(dest_path):
+          shutil.rmtree(dest_path)
+        shutil.copytree(entry.path, dest_path)
+      else:
+        shutil.copy(entry.path, dest_path)
 
 
 def _make_installers(release_metadata):
@@ -561,37 +588,52 @@ def _create_github_release(release_metadata):
     'Authorization': f'Bearer {release_metadata.access_token}',
   }
   
-  response = requests.post(
-    releases_url, headers=access_token_header, data=json.dumps(data_dict))
+  # `requests` is imported here as it is only needed for actual releases and
+  # takes a while to import.
+  import requests
   
-  response.raise_for_status()
+  with requests.Session() as session:
+    session.headers.update(access_token_header)
+    
+    response = session.post(releases_url, json=data_dict)
+    
+    response.raise_for_status()
+    
+    # Strip the URI template suffix (e.g. `{?name,label}`).
+    upload_url = response.json()['upload_url'].split('{', 1)[0]
+    
+    _upload_installers_to_github(release_metadata, upload_url, session)
+
+
+def _upload_installers_to_github(release_metadata, upload_url, session):
+  filepaths_and_file_extensions = []
+  dirpaths = [INSTALLERS_OUTPUT_DIRPATH]
   
-  upload_url = re.sub(r'^(.*)\{.*?$', r'\1', response.json()['upload_url'])
+  while dirpaths:
+    with os.scandir(dirpaths.pop()) as entries:
+      for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+          dirpaths.append(entry.path)
+        else:
+          file_extension = os.path.splitext(entry.name)[1][1:]
+          if file_extension in FILE_EXTENSIONS_AND_MIME_TYPES:
+            filepaths_and_file_extensions.append((entry.path, file_extension))
   
-  _upload_installers_to_github(release_metadata, upload_url, access_token_header)
+  for filepath, file_extension in filepaths_and_file_extensions:
+    _upload_installer_to_github(upload_url, session, filepath, file_extension)
 
 
-def _upload_installers_to_github(release_metadata, upload_url, access_token_header):
-  for root_dirpath, _unused, files in os.walk(INSTALLERS_OUTPUT_DIRPATH):
-    for filename in files:
-      _unused, file_extension = os.path.splitext(filename)
-      if file_extension:
-        file_extension = file_extension[1:]
-        if file_extension not in FILE_EXTENSIONS_AND_MIME_TYPES:
-          continue
-      else:
-        continue
-      
-      with open(os.path.join(root_dirpath, filename), 'rb') as f:
-        file_contents = f.read()
-      
-      headers = dict(access_token_header)
-      headers['Content-Type'] = FILE_EXTENSIONS_AND_MIME_TYPES[file_extension]
-      
-      response = requests.post(
-        upload_url, headers=headers, data=file_contents, params={'name': filename})
-      
-      response.raise_for_status()
+def _upload_installer_to_github(upload_url, session, filepath, file_extension):
+  # Passing the file object makes `requests` stream the file contents rather
+  # than holding the entire file in memory.
+  with open(filepath, 'rb') as f:
+    response = session.post(
+      upload_url,
+      headers={'Content-Type': FILE_EXTENSIONS_AND_MIME_TYPES[file_extension]},
+      data=f,
+      params={'name': os.path.basename(filepath)})
+  
+  response.raise_for_status()
 
 
 def _rollback(release_metadata):
@@ -623,27 +665,58 @@ def _print_error(message):
 
 class _ReleaseMetadata:
   
+  __slots__ = (
+    '_options',
+    '_repo',
+    '_gh_pages_repo',
+    '_new_version',
+    '_release_message_header',
+    'new_version_release_notes',
+    'new_version_release_date',
+    'new_version_release_date_for_filename',
+    'access_token',
+    '_last_commit_id_before_release',
+    '_last_gh_pages_commit_id_before_release',
+  )
+  
   def __init__(self, repo, gh_pages_repo, **kwargs):
+    for name in kwargs:
+      if hasattr(type(self), name):
+        raise TypeError(
+          (f'keyword argument "{name}" already exists in class {type(self).__qualname__};'
+           ' to prevent name clashes, rename conflicting script options'))
+    
+    # Script options are stored separately and are read-only.
+    object.__setattr__(self, '_options', dict(kwargs))
+    
     self._repo = repo
     self._gh_pages_repo = gh_pages_repo
     
-    self.new_version = None
+    self._new_version = None
+    self._release_message_header = None
     self.new_version_release_notes = ''
+    self.access_token = None
 
     current_time = time.gmtime()
     self.new_version_release_date = time.strftime('%B %d, %Y', current_time)
     self.new_version_release_date_for_filename = time.strftime('%Y-%m-%d', current_time)
     
-    self._last_commit_id_before_release = self._repo.git.rev_parse('HEAD')
-    self._last_gh_pages_commit_id_before_release = self._gh_pages_repo.git.rev_parse('HEAD')
+    self._last_commit_id_before_release = self._repo.head.commit.hexsha
+    self._last_gh_pages_commit_id_before_release = self._gh_pages_repo.head.commit.hexsha
+  
+  def __getattr__(self, name):
+    # This is only called if `name` is not a slot or a property.
+    try:
+      return object.__getattribute__(self, '_options')[name]
+    except KeyError:
+      raise AttributeError(
+        f"'{type(self).__qualname__}' object has no attribute '{name}'") from None
+  
+  def __setattr__(self, name, value):
+    if name in self._options:
+      raise AttributeError(f'script option "{name}" is read-only')
     
-    for name, value in kwargs.items():
-      if hasattr(self, name):
-        raise TypeError(
-          (f'keyword argument "{name}" already exists in class {type(self).__qualname__};'
-           ' to prevent name clashes, rename conflicting script options'))
-      
-      utils.create_read_only_property(self, name, value)
+    super().__setattr__(name, value)
   
   @property
   def repo(self):
@@ -661,6 +734,19 @@ def last_commit_id_before_release(self):
   def last_gh_pages_commit_id_before_release(self):
     return self._last_gh_pages_commit_id_before_release
   
+  @property
+  def new_version(self):
+    return self._new_version
+  
+  @new_version.setter
+  def new_version(self, value):
+    self._new_version = value
+    self._release_message_header = f'Release {value}'
+  
+  @property
+  def release_message_header(self):
+    return self._release_message_header
+  
   @property
   def release_tag(self):
     return self.new_version
@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+
+import parameterized
+
+from dev.git_hooks import commit_msg
+
+
+class TestCommitMsgCapitalizeFirstLetterInHeader(unittest.TestCase):
+
+  @parameterized.parameterized.expand([
+    ['scope_and_lowercase_header',
+     'gui: add drag icon',
+     'gui: Add drag icon'],
+    ['scope_and_capitalized_header',
+     'gui: Add drag icon',
+     'gui: Add drag icon'],
+    ['scope_without_space_after_colon',
+     'gui:add drag icon',
+     'gui: Add drag icon'],
+    ['no_scope',
+     'add drag icon',
+     'add drag icon'],
+    ['multiple_colons',
+     'gui: fix: drag icon',
+     'gui: Fix: drag icon'],
+  ])
+  def test_commit_msg_capitalize_first_letter_in_header(
+        self, _test_case_suffix, first_line, expected_first_line):
+    self.assertEqual(
+      commit_msg.commit_msg_capitalize_first_letter_in_header(first_line, []),
+      (expected_first_line, []))
+
+
+class TestCommitMsgRemoveTrailingPeriodFromFirstLine(unittest.TestCase):
+
+  @parameterized.parameterized.expand([
+    ['single_period', 'Fix drag icon.', 'Fix drag icon'],
+    ['multiple_periods', 'Fix drag icon...', 'Fix drag icon'],
+    ['no_period', 'Fix drag icon', 'Fix drag icon'],
+    ['period_inside', 'Fix drag icon in v1.2', 'Fix drag icon in v1.2'],
+  ])
+  def test_commit_msg_remove_trailing_period_from_first_line(
+        self, _test_case_suffix, first_line, expected_first_line):
+    self.assertEqual(
+      commit_msg.commit_msg_remove_trailing_period_from_first_line(first_line, []),
+      (expected_first_line, []))
+
+
+class TestCommitMsgWrapMessageBody(unittest.TestCase):
+
+  def test_short_lines_are_not_wrapped(self):
+    body = ['', 'Short line.', '', 'Another short line.']
+
+    self.assertEqual(
+      commit_msg.commit_msg_wrap_message_body('Header', body),
+      ('Header', ['', 'Short line.', '', 'Another short line.']))
+
+  def test_long_line_is_wrapped(self):
+    long_line = ' '.join(['word'] * 30)
+
+    _first_line, wrapped_body = commit_msg.commit_msg_wrap_message_body('Header', ['', long_line])
+
+    self.assertEqual(wrapped_body[0], '')
+
+    wrapped_lines = wrapped_body[1].split('\n')
+
+    self.assertGreater(len(wrapped_lines), 1)
+    for line in wrapped_lines:
+      self.assertLessEqual(len(line), commit_msg.MESSAGE_BODY_MAX_CHAR_LINE_LENGTH)
+
+    self.assertEqual(''.join(wrapped_lines), long_line)
+
+  def test_empty_body(self):
+    self.assertEqual(commit_msg.commit_msg_wrap_message_body('Header', []), ('Header', []))
+
+
+class TestCommitMsgRemoveTrailingNewlines(unittest.TestCase):
+
+  @parameterized.parameterized.expand([
+    ['no_body', [], []],
+    ['no_trailing_empty_lines', ['', 'Body'], ['', 'Body']],
+    ['single_trailing_empty_line', ['', 'Body', ''], ['', 'Body']],
+    ['multiple_trailing_empty_lines', ['', 'Body', '', '', ''], ['', 'Body']],
+    ['empty_lines_inside_body_are_kept', ['', 'Body', '', 'More', ''], ['', 'Body', '', 'More']],
+    ['only_empty_lines', ['', '', ''], []],
+  ])
+  def test_commit_msg_remove_trailing_newlines(self, _test_case_suffix, body, expected_body):
+    self.assertEqual(
+      commit_msg.commit_msg_remove_trailing_newlines('Header', body),
+      ('Header', expected_body))
+
+
+class TestProcessCommitMessages(unittest.TestCase):
+
+  def setUp(self):
+    file_descriptor, self.commit_message_filepath = tempfile.mkstemp()
+    os.close(file_descriptor)
+
+  def tearDown(self):
+    os.remove(self.commit_message_filepath)
+
+  def _process_commit_message(self, commit_message):
+    with open(self.commit_message_filepath, 'w') as f:
+      f.write(commit_message)
+
+    commit_msg.process_commit_messages(self.commit_message_filepath)
+
+    with open(self.commit_message_filepath, 'r') as f:
+      return f.read()
+
+  def test_header_only(self):
+    self.assertEqual(self._process_commit_message('gui: add drag icon.\n'), 'gui: Add drag icon')
+
+  def test_header_and_body(self):
+    self.assertEqual(
+      self._process_commit_message('gui: add drag icon.\n\nReuse the window.\n\n\n'),
+      'gui: Add drag icon\n\nReuse the window.')
+
+  def test_first_line_too_long_exits(self):
+    with self.assertRaises(SystemExit):
+      self._process_commit_message('a' * (commit_msg.FIRST_LINE_MAX_CHAR_LENGTH + 1))
+
+  def test_non_empty_second_line_exits(self):
+    with self.assertRaises(SystemExit):
+      self._process_commit_message('Header\nBody without empty line')
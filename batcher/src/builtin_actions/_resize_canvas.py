@@ -1,5 +1,7 @@
 """Built-in "Resize Canvas" action."""
 
+import math
+
 import gi
 
 gi.require_version('Gimp', '3.0')
@@ -42,195 +44,272 @@ def resize_canvas(
       resize_mode,
       set_fill_color,
       fill_color,
+      **resize_mode_arguments,
+):
+  object_to_resize_width = object_to_resize.get_width()
+  object_to_resize_height = object_to_resize.get_height()
+
+  object_to_resize_is_image = isinstance(object_to_resize, Gimp.Image)
+
+  if object_to_resize_is_image:
+    object_to_resize_offsets = None
+  else:
+    object_to_resize_offsets = object_to_resize.get_offsets()
+
+  resize_pixels = _RESIZE_MODE_FUNCTIONS[resize_mode](
+    batcher,
+    object_to_resize_width,
+    object_to_resize_height,
+    object_to_resize_offsets,
+    **resize_mode_arguments,
+  )
+
+  if resize_pixels is None:
+    return
+
+  offset_x_pixels, offset_y_pixels, width_pixels, height_pixels = resize_pixels
+
+  _do_resize(
+    batcher,
+    object_to_resize,
+    offset_x_pixels,
+    offset_y_pixels,
+    width_pixels,
+    height_pixels,
+    set_fill_color,
+    fill_color,
+    object_to_resize_is_image,
+    object_to_resize_width,
+    object_to_resize_height,
+    object_to_resize_offsets,
+  )
+
+
+def _get_pixels_for_resize_from_edges(
+      batcher,
+      object_to_resize_width,
+      object_to_resize_height,
+      _object_to_resize_offsets,
       resize_from_edges_same_amount_for_each_side,
       resize_from_edges_amount,
       resize_from_edges_top,
       resize_from_edges_bottom,
       resize_from_edges_left,
       resize_from_edges_right,
+      **_kwargs,
+):
+  if resize_from_edges_same_amount_for_each_side:
+    # The amount is converted once per axis as the resolution may differ
+    # between axes.
+    resize_from_edges_amount_x_pixels, resize_from_edges_amount_y_pixels = (
+      builtin_actions_utils.units_to_pixels(
+        batcher, [(resize_from_edges_amount, 'x'), (resize_from_edges_amount, 'y')]))
+
+    resize_from_edges_top_pixels = resize_from_edges_amount_y_pixels
+    resize_from_edges_bottom_pixels = resize_from_edges_amount_y_pixels
+    resize_from_edges_left_pixels = resize_from_edges_amount_x_pixels
+    resize_from_edges_right_pixels = resize_from_edges_amount_x_pixels
+  else:
+    (
+      resize_from_edges_top_pixels,
+      resize_from_edges_bottom_pixels,
+      resize_from_edges_left_pixels,
+      resize_from_edges_right_pixels,
+    ) = builtin_actions_utils.units_to_pixels(
+      batcher,
+      [
+        (resize_from_edges_top, 'y'),
+        (resize_from_edges_bottom, 'y'),
+        (resize_from_edges_left, 'x'),
+        (resize_from_edges_right, 'x'),
+      ],
+    )
+
+  offset_x_pixels = resize_from_edges_left_pixels
+  offset_y_pixels = resize_from_edges_top_pixels
+
+  width_pixels = max(
+    object_to_resize_width + resize_from_edges_left_pixels + resize_from_edges_right_pixels, 1)
+  height_pixels = max(
+    object_to_resize_height + resize_from_edges_top_pixels + resize_from_edges_bottom_pixels, 1)
+
+  return offset_x_pixels, offset_y_pixels, width_pixels, height_pixels
+
+
+def _get_pixels_for_resize_from_position(
+      batcher,
+      object_to_resize_width,
+      object_to_resize_height,
+      _object_to_resize_offsets,
       resize_from_position_anchor,
       resize_from_position_width,
       resize_from_position_height,
+      **_kwargs,
+):
+  offset_x_pixels, offset_y_pixels, width_pixels, height_pixels = (
+    _get_resize_from_position_area_pixels(
+      batcher,
+      object_to_resize_width,
+      object_to_resize_height,
+      resize_from_position_anchor,
+      resize_from_position_width,
+      resize_from_position_height,
+    ))
+
+  width_pixels = max(width_pixels, 1)
+  height_pixels = max(height_pixels, 1)
+
+  return offset_x_pixels, offset_y_pixels, width_pixels, height_pixels
+
+
+def _get_pixels_for_resize_to_aspect_ratio(
+      batcher,
+      object_to_resize_width,
+      object_to_resize_height,
+      _object_to_resize_offsets,
+      resize_to_aspect_ratio_ratio,
+      resize_to_aspect_ratio_position,
+      resize_to_aspect_ratio_position_custom,
+      **_kwargs,
+):
+  offset_x_pixels, offset_y_pixels, width_pixels, height_pixels = (
+    _get_resize_to_aspect_ratio_pixels(
+      batcher,
+      object_to_resize_width,
+      object_to_resize_height,
       resize_to_aspect_ratio_ratio,
       resize_to_aspect_ratio_position,
       resize_to_aspect_ratio_position_custom,
+    ))
+
+  width_pixels = max(width_pixels, 1)
+  height_pixels = max(height_pixels, 1)
+
+  return offset_x_pixels, offset_y_pixels, width_pixels, height_pixels
+
+
+def _get_pixels_for_resize_to_area(
+      batcher,
+      _object_to_resize_width,
+      _object_to_resize_height,
+      _object_to_resize_offsets,
       resize_to_area_x,
       resize_to_area_y,
       resize_to_area_width,
       resize_to_area_height,
-      resize_to_layer_size_layers,
-      resize_to_image_size_image,
+      **_kwargs,
 ):
-  if resize_mode == ResizeModes.RESIZE_FROM_EDGES:
-    if resize_from_edges_same_amount_for_each_side:
-      resize_from_edges_top = resize_from_edges_amount
-      resize_from_edges_bottom = resize_from_edges_amount
-      resize_from_edges_left = resize_from_edges_amount
-      resize_from_edges_right = resize_from_edges_amount
-
-    resize_from_edges_top_pixels = builtin_actions_utils.unit_to_pixels(
-      batcher, resize_from_edges_top, 'y')
-    resize_from_edges_bottom_pixels = builtin_actions_utils.unit_to_pixels(
-      batcher, resize_from_edges_bottom, 'y')
-    resize_from_edges_left_pixels = builtin_actions_utils.unit_to_pixels(
-      batcher, resize_from_edges_left, 'x')
-    resize_from_edges_right_pixels = builtin_actions_utils.unit_to_pixels(
-      batcher, resize_from_edges_right, 'x')
-
-    object_to_resize_width = object_to_resize.get_width()
-    object_to_resize_height = object_to_resize.get_height()
-    offset_x_pixels = resize_from_edges_left_pixels
-    offset_y_pixels = resize_from_edges_top_pixels
-
-    width_pixels = (
-      object_to_resize_width + resize_from_edges_left_pixels + resize_from_edges_right_pixels)
-    width_pixels = _clamp_value(width_pixels, min_value=1)
-
-    height_pixels = (
-      object_to_resize_height + resize_from_edges_top_pixels + resize_from_edges_bottom_pixels)
-    height_pixels = _clamp_value(height_pixels, min_value=1)
-
-    _do_resize(
-      batcher,
-      object_to_resize,
-      offset_x_pixels,
-      offset_y_pixels,
-      width_pixels,
-      height_pixels,
-      set_fill_color,
-      fill_color,
-    )
-  elif resize_mode == ResizeModes.RESIZE_FROM_POSITION:
-    object_to_resize_width = object_to_resize.get_width()
-    object_to_resize_height = object_to_resize.get_height()
-
-    offset_x_pixels, offset_y_pixels, width_pixels, height_pixels = (
-      _get_resize_from_position_area_pixels(
-        batcher,
-        object_to_resize_width,
-        object_to_resize_height,
-        resize_from_position_anchor,
-        resize_from_position_width,
-        resize_from_position_height,
-      ))
-
-    width_pixels = _clamp_value(width_pixels, min_value=1)
-    height_pixels = _clamp_value(height_pixels, min_value=1)
-
-    _do_resize(
+  offset_x_pixels, offset_y_pixels, width_pixels, height_pixels = (
+    builtin_actions_utils.units_to_pixels(
       batcher,
-      object_to_resize,
-      offset_x_pixels,
-      offset_y_pixels,
-      width_pixels,
-      height_pixels,
-      set_fill_color,
-      fill_color,
-    )
-  elif resize_mode == ResizeModes.RESIZE_TO_ASPECT_RATIO:
-    object_to_resize_width = object_to_resize.get_width()
-    object_to_resize_height = object_to_resize.get_height()
-
-    offset_x_pixels, offset_y_pixels, width_pixels, height_pixels = (
-      _get_resize_to_aspect_ratio_pixels(
-        batcher,
-        object_to_resize_width,
-        object_to_resize_height,
-        resize_to_aspect_ratio_ratio,
-        resize_to_aspect_ratio_position,
-        resize_to_aspect_ratio_position_custom,
-      ))
-
-    width_pixels = _clamp_value(width_pixels, min_value=1)
-    height_pixels = _clamp_value(height_pixels, min_value=1)
-
-    _do_resize(
-      batcher,
-      object_to_resize,
-      offset_x_pixels,
-      offset_y_pixels,
-      width_pixels,
-      height_pixels,
-      set_fill_color,
-      fill_color,
-    )
-  elif resize_mode == ResizeModes.RESIZE_TO_AREA:
-    offset_x_pixels = builtin_actions_utils.unit_to_pixels(batcher, resize_to_area_x, 'x')
-    offset_y_pixels = builtin_actions_utils.unit_to_pixels(batcher, resize_to_area_y, 'y')
-    width_pixels = builtin_actions_utils.unit_to_pixels(batcher, resize_to_area_width, 'x')
-    height_pixels = builtin_actions_utils.unit_to_pixels(batcher, resize_to_area_height, 'y')
+      [
+        (resize_to_area_x, 'x'),
+        (resize_to_area_y, 'y'),
+        (resize_to_area_width, 'x'),
+        (resize_to_area_height, 'y'),
+      ],
+    ))
 
-    width_pixels = _clamp_value(width_pixels, min_value=1)
-    height_pixels = _clamp_value(height_pixels, min_value=1)
+  width_pixels = max(width_pixels, 1)
+  height_pixels = max(height_pixels, 1)
 
-    _do_resize(
-      batcher,
-      object_to_resize,
-      offset_x_pixels,
-      offset_y_pixels,
-      width_pixels,
-      height_pixels,
-      set_fill_color,
-      fill_color,
-    )
-  elif resize_mode == ResizeModes.RESIZE_TO_LAYER_SIZE:
-    layers = resize_to_layer_size_layers
+  return offset_x_pixels, offset_y_pixels, width_pixels, height_pixels
 
-    if len(layers) == 1:
-      layer = layers[0]
 
-      layer_offsets = layer.get_offsets()
+def _get_pixels_for_resize_to_layer_size(
+      _batcher,
+      _object_to_resize_width,
+      _object_to_resize_height,
+      _object_to_resize_offsets,
+      resize_to_layer_size_layers,
+      **_kwargs,
+):
+  layers = resize_to_layer_size_layers
 
-      _do_resize(
-        batcher,
-        object_to_resize,
-        -layer_offsets.offset_x,
-        -layer_offsets.offset_y,
-        layer.get_width(),
-        layer.get_height(),
-        set_fill_color,
-        fill_color,
-      )
-    elif len(layers) > 1:
-      layer_offset_list = [layer.get_offsets() for layer in layers]
-
-      min_x = min(offset.offset_x for offset in layer_offset_list)
-      min_y = min(offset.offset_y for offset in layer_offset_list)
-
-      max_x = max(
-        offset.offset_x + layer.get_width() for layer, offset in zip(layers, layer_offset_list))
-      max_y = max(
-        offset.offset_y + layer.get_height() for layer, offset in zip(layers, layer_offset_list))
-
-      _do_resize(
-        batcher,
-        object_to_resize,
-        -min_x,
-        -min_y,
-        max_x - min_x,
-        max_y - min_y,
-        set_fill_color,
-        fill_color,
-      )
-  elif resize_mode == ResizeModes.RESIZE_TO_IMAGE_SIZE:
-    if isinstance(object_to_resize, Gimp.Image):
-      offset_x = 0
-      offset_y = 0
-    else:
-      offsets = object_to_resize.get_offsets()
-      offset_x = offsets.offset_x
-      offset_y = offsets.offset_y
-
-    _do_resize(
-      batcher,
-      object_to_resize,
-      offset_x,
-      offset_y,
-      resize_to_image_size_image.get_width(),
-      resize_to_image_size_image.get_height(),
-      set_fill_color,
-      fill_color,
+  if len(layers) == 1:
+    layer = layers[0]
+
+    layer_offsets = layer.get_offsets()
+
+    return (
+      -layer_offsets.offset_x,
+      -layer_offsets.offset_y,
+      layer.get_width(),
+      layer.get_height(),
     )
+  elif len(layers) > 1:
+    min_x = min_y = math.inf
+    max_x = max_y = -math.inf
+
+    for layer in layers:
+      layer_offsets = layer.get_offsets()
+      layer_x = layer_offsets.offset_x
+      layer_y = layer_offsets.offset_y
+
+      if layer_x < min_x:
+        min_x = layer_x
+      if layer_y < min_y:
+        min_y = layer_y
+
+      layer_right = layer_x + layer.get_width()
+      layer_bottom = layer_y + layer.get_height()
+
+      if layer_right > max_x:
+        max_x = layer_right
+      if layer_bottom > max_y:
+        max_y = layer_bottom
+
+    return -min_x, -min_y, max_x - min_x, max_y - min_y
+  else:
+    return None
+
+
+def _get_pixels_for_resize_to_image_size(
+      _batcher,
+      _object_to_resize_width,
+      _object_to_resize_height,
+      object_to_resize_offsets,
+      resize_to_image_size_image,
+      **_kwargs,
+):
+  if object_to_resize_offsets is None:
+    offset_x = 0
+    offset_y = 0
+  else:
+    offset_x = object_to_resize_offsets.offset_x
+    offset_y = object_to_resize_offsets.offset_y
+
+  return (
+    offset_x,
+    offset_y,
+    resize_to_image_size_image.get_width(),
+    resize_to_image_size_image.get_height(),
+  )
+
+
+_RESIZE_MODE_FUNCTIONS = {
+  ResizeModes.RESIZE_FROM_EDGES: _get_pixels_for_resize_from_edges,
+  ResizeModes.RESIZE_FROM_POSITION: _get_pixels_for_resize_from_position,
+  ResizeModes.RESIZE_TO_ASPECT_RATIO: _get_pixels_for_resize_to_aspect_ratio,
+  ResizeModes.RESIZE_TO_AREA: _get_pixels_for_resize_to_area,
+  ResizeModes.RESIZE_TO_LAYER_SIZE: _get_pixels_for_resize_to_layer_size,
+  ResizeModes.RESIZE_TO_IMAGE_SIZE: _get_pixels_for_resize_to_image_size,
+}
+
+
+# Each anchor point maps to the number of halves of the added width and height
+# to place before the original contents.
+_ANCHOR_POINT_POSITION_HALVES = {
+  builtin_actions_utils.AnchorPoints.TOP_LEFT: (0, 0),
+  builtin_actions_utils.AnchorPoints.TOP: (1, 0),
+  builtin_actions_utils.AnchorPoints.TOP_RIGHT: (2, 0),
+  builtin_actions_utils.AnchorPoints.LEFT: (0, 1),
+  builtin_actions_utils.AnchorPoints.CENTER: (1, 1),
+  builtin_actions_utils.AnchorPoints.RIGHT: (2, 1),
+  builtin_actions_utils.AnchorPoints.BOTTOM_LEFT: (0, 2),
+  builtin_actions_utils.AnchorPoints.BOTTOM: (1, 2),
+  builtin_actions_utils.AnchorPoints.BOTTOM_RIGHT: (2, 2),
+}
 
 
 def _get_resize_from_position_area_pixels(
@@ -241,55 +320,15 @@ def _get_resize_from_position_area_pixels(
       width,
       height,
 ):
-  width_pixels = builtin_actions_utils.unit_to_pixels(batcher, width, 'x')
-  height_pixels = builtin_actions_utils.unit_to_pixels(batcher, height, 'y')
-
-  position = [0, 0]
-
-  if resize_from_position_anchor == builtin_actions_utils.AnchorPoints.TOP_LEFT:
-    position = [0, 0]
-  elif resize_from_position_anchor == builtin_actions_utils.AnchorPoints.TOP:
-    position = [
-      round((width_pixels - object_to_resize_width) / 2),
-      0,
-    ]
-  elif resize_from_position_anchor == builtin_actions_utils.AnchorPoints.TOP_RIGHT:
-    position = [
-      width_pixels - object_to_resize_width,
-      0,
-    ]
-  elif resize_from_position_anchor == builtin_actions_utils.AnchorPoints.LEFT:
-    position = [
-      0,
-      round((height_pixels - object_to_resize_height) / 2),
-    ]
-  elif resize_from_position_anchor == builtin_actions_utils.AnchorPoints.CENTER:
-    position = [
-      round((width_pixels - object_to_resize_width) / 2),
-      round((height_pixels - object_to_resize_height) / 2),
-    ]
-  elif resize_from_position_anchor == builtin_actions_utils.AnchorPoints.RIGHT:
-    position = [
-      width_pixels - object_to_resize_width,
-      round((height_pixels - object_to_resize_height) / 2),
-    ]
-  elif resize_from_position_anchor == builtin_actions_utils.AnchorPoints.BOTTOM_LEFT:
-    position = [
-      0,
-      height_pixels - object_to_resize_height,
-    ]
-  elif resize_from_position_anchor == builtin_actions_utils.AnchorPoints.BOTTOM:
-    position = [
-      round((width_pixels - object_to_resize_width) / 2),
-      height_pixels - object_to_resize_height,
-    ]
-  elif resize_from_position_anchor == builtin_actions_utils.AnchorPoints.BOTTOM_RIGHT:
-    position = [
-      width_pixels - object_to_resize_width,
-      height_pixels - object_to_resize_height,
-    ]
+  width_pixels, height_pixels = builtin_actions_utils.units_to_pixels(
+    batcher, [(width, 'x'), (height, 'y')])
+
+  halves_x, halves_y = _ANCHOR_POINT_POSITION_HALVES[resize_from_position_anchor]
 
-  return position[0], position[1], width_pixels, height_pixels
+  offset_x_pixels = _halve((width_pixels - object_to_resize_width) * halves_x)
+  offset_y_pixels = _halve((height_pixels - object_to_resize_height) * halves_y)
+
+  return offset_x_pixels, offset_y_pixels, width_pixels, height_pixels
 
 
 def _get_resize_to_aspect_ratio_pixels(
@@ -309,37 +348,68 @@ def _get_resize_to_aspect_ratio_pixels(
     width_pixels = object_to_resize_width
     height_pixels = round(height_pixels)
     offset_x_pixels = 0
-
-    offset_y_pixels = 0
-    if resize_to_aspect_ratio_position == builtin_actions_utils.Positions.START:
-      offset_y_pixels = 0
-    elif resize_to_aspect_ratio_position == builtin_actions_utils.Positions.CENTER:
-      offset_y_pixels = round((height_pixels - object_to_resize_height) / 2)
-    elif resize_to_aspect_ratio_position == builtin_actions_utils.Positions.END:
-      offset_y_pixels = height_pixels - object_to_resize_height
-    elif resize_to_aspect_ratio_position == builtin_actions_utils.Positions.CUSTOM:
-      offset_y_pixels = builtin_actions_utils.unit_to_pixels(
-        batcher, resize_to_aspect_ratio_position_custom, 'y')
+    offset_y_pixels = _get_resize_to_aspect_ratio_offset(
+      batcher,
+      resize_to_aspect_ratio_position,
+      resize_to_aspect_ratio_position_custom,
+      height_pixels - object_to_resize_height,
+      'y',
+    )
   else:
     height_unit_length = object_to_resize_height / ratio_height
     width_pixels = round(height_unit_length * ratio_width)
     height_pixels = object_to_resize_height
+    offset_x_pixels = _get_resize_to_aspect_ratio_offset(
+      batcher,
+      resize_to_aspect_ratio_position,
+      resize_to_aspect_ratio_position_custom,
+      width_pixels - object_to_resize_width,
+      'x',
+    )
     offset_y_pixels = 0
 
-    offset_x_pixels = 0
-    if resize_to_aspect_ratio_position == builtin_actions_utils.Positions.START:
-      offset_x_pixels = 0
-    elif resize_to_aspect_ratio_position == builtin_actions_utils.Positions.CENTER:
-      offset_x_pixels = round((width_pixels - object_to_resize_width) / 2)
-    elif resize_to_aspect_ratio_position == builtin_actions_utils.Positions.END:
-      offset_x_pixels = width_pixels - object_to_resize_width
-    elif resize_to_aspect_ratio_position == builtin_actions_utils.Positions.CUSTOM:
-      offset_x_pixels = builtin_actions_utils.unit_to_pixels(
-        batcher, resize_to_aspect_ratio_position_custom, 'x')
-
   return offset_x_pixels, offset_y_pixels, width_pixels, height_pixels
 
 
+_POSITION_CUSTOM = builtin_actions_utils.Positions.CUSTOM
+
+# Each position maps to the number of halves of the added pixels to place
+# before the original contents.
+_POSITION_HALVES = {
+  builtin_actions_utils.Positions.START: 0,
+  builtin_actions_utils.Positions.CENTER: 1,
+  builtin_actions_utils.Positions.END: 2,
+}
+
+
+def _get_resize_to_aspect_ratio_offset(
+      batcher,
+      resize_to_aspect_ratio_position,
+      resize_to_aspect_ratio_position_custom,
+      added_pixels,
+      resolution_axis,
+):
+  position_halves = _POSITION_HALVES.get(resize_to_aspect_ratio_position)
+
+  if position_halves is not None:
+    return _halve(added_pixels * position_halves)
+  elif resize_to_aspect_ratio_position == _POSITION_CUSTOM:
+    return builtin_actions_utils.unit_to_pixels(
+      batcher, resize_to_aspect_ratio_position_custom, resolution_axis)
+  else:
+    return 0
+
+
+def _halve(pixels):
+  """Returns ``round(pixels / 2)`` for an integer, without converting to
+  float.
+
+  Like `round()`, halves are rounded to the nearest even number.
+  """
+  half = pixels >> 1
+  return half + (pixels & half & 1)
+
+
 def _do_resize(
       batcher,
       object_to_resize,
@@ -349,17 +419,17 @@ def _do_resize(
       height_pixels,
       set_fill_color,
       fill_color,
+      object_to_resize_is_image,
+      orig_object_width,
+      orig_object_height,
+      orig_object_offsets,
 ):
-  if isinstance(object_to_resize, Gimp.Image):
+  if object_to_resize_is_image:
     orig_object_x = offset_x_pixels
     orig_object_y = offset_y_pixels
   else:
-    offsets = object_to_resize.get_offsets()
-    orig_object_x = offsets.offset_x
-    orig_object_y = offsets.offset_y
-
-  orig_object_width = object_to_resize.get_width()
-  orig_object_height = object_to_resize.get_height()
+    orig_object_x = orig_object_offsets.offset_x
+    orig_object_y = orig_object_offsets.offset_y
 
   if isinstance(object_to_resize, Gimp.TextLayer):
     object_to_resize.resize(width_pixels, height_pixels)
@@ -370,7 +440,10 @@ def _do_resize(
     _fill_with_color(
       batcher,
       object_to_resize,
+      object_to_resize_is_image,
       fill_color,
+      width_pixels,
+      height_pixels,
       orig_object_x,
       orig_object_y,
       orig_object_width,
@@ -381,25 +454,28 @@ def _do_resize(
 def _fill_with_color(
       batcher,
       object_to_resize,
+      object_to_resize_is_image,
       fill_color,
+      color_layer_width,
+      color_layer_height,
       selection_x,
       selection_y,
       selection_width,
       selection_height,
 ):
-  if isinstance(object_to_resize, Gimp.Image):
+  if object_to_resize_is_image:
     color_layer_offset_x = 0
     color_layer_offset_y = 0
-  else:
-    color_layer_offsets = object_to_resize.get_offsets()
-    color_layer_offset_x = color_layer_offsets.offset_x
-    color_layer_offset_y = color_layer_offsets.offset_y
 
-  if isinstance(object_to_resize, Gimp.Image):
     drawable_to_fill = builtin_actions_utils.get_best_matching_layer_from_image(
       batcher, object_to_resize)
     image_of_drawable_to_fill = object_to_resize
   else:
+    # The offsets are obtained anew as resizing a layer changes its offsets.
+    color_layer_offsets = object_to_resize.get_offsets()
+    color_layer_offset_x = color_layer_offsets.offset_x
+    color_layer_offset_y = color_layer_offsets.offset_y
+
     drawable_to_fill = object_to_resize
     image_of_drawable_to_fill = object_to_resize.get_image()
 
@@ -409,8 +485,8 @@ def _fill_with_color(
     drawable_to_fill,
     color_layer_offset_x,
     color_layer_offset_y,
-    object_to_resize.get_width(),
-    object_to_resize.get_height(),
+    color_layer_width,
+    color_layer_height,
     selection_x,
     selection_y,
     selection_width,
@@ -418,65 +494,25 @@ def _fill_with_color(
   )
 
 
-def _clamp_value(value, min_value=None, max_value=None):
-  if min_value is not None:
-    if value < min_value:
-      value = min_value
-
-  if max_value is not None:
-    if value > max_value:
-      value = max_value
-
-  return value
-
-
 def _on_after_add_resize_canvas_action(_actions, action, _orig_action_dict, _settings):
-  action['arguments/resize_from_edges_same_amount_for_each_side'].connect_event(
-    'value-changed',
-    _set_visible_for_resize_from_edges_settings,
-    action['arguments'],
-  )
+  for setting_path, event_types, event_handler, event_handler_arg_path in (
+        _RESIZE_CANVAS_EVENT_BINDINGS):
+    setting = action[setting_path]
+    event_handler_arg = action[event_handler_arg_path]
 
-  action['arguments/resize_from_edges_same_amount_for_each_side'].connect_event(
-    'gui-visible-changed',
-    _set_visible_for_resize_from_edges_settings,
-    action['arguments'],
-  )
-
-  action['arguments/resize_to_aspect_ratio_position'].connect_event(
-    'value-changed',
-    _set_visible_for_resize_to_aspect_ratio_position_custom,
-    action['arguments/resize_to_aspect_ratio_position_custom'],
-  )
-
-  action['arguments/resize_to_aspect_ratio_position'].connect_event(
-    'gui-visible-changed',
-    _set_visible_for_resize_to_aspect_ratio_position_custom,
-    action['arguments/resize_to_aspect_ratio_position_custom'],
-  )
+    for event_type in event_types:
+      setting.connect_event(event_type, event_handler, event_handler_arg)
 
   _set_visible_for_fill_color(
     action['arguments/set_fill_color'],
     action['arguments/fill_color'],
   )
 
-  action['arguments/set_fill_color'].connect_event(
-    'value-changed',
-    _set_visible_for_fill_color,
-    action['arguments/fill_color'],
-  )
-
   _set_visible_for_resize_mode_settings(
     action['arguments/resize_mode'],
     action['arguments'],
   )
 
-  action['arguments/resize_mode'].connect_event(
-    'value-changed',
-    _set_visible_for_resize_mode_settings,
-    action['arguments'],
-  )
-
   builtin_commands_common.set_up_display_name_change_for_command(
     _set_display_name_for_resize_canvas,
     action['arguments/resize_mode'],
@@ -504,7 +540,7 @@ def _set_visible_for_resize_to_aspect_ratio_position_custom(
 ):
   is_visible = resize_to_aspect_ratio_position_setting.gui.get_visible()
   is_selected = (
-    resize_to_aspect_ratio_position_setting.value == builtin_actions_utils.Positions.CUSTOM)
+    resize_to_aspect_ratio_position_setting.value == _POSITION_CUSTOM)
 
   resize_to_aspect_ratio_position_custom_setting.gui.set_visible(is_visible and is_selected)
 
@@ -520,30 +556,61 @@ def _set_visible_for_resize_mode_settings(
       resize_mode_setting,
       resize_arguments_group,
 ):
+  visible_setting_names = _VISIBLE_SETTING_NAMES_PER_RESIZE_MODE.get(
+    resize_mode_setting.value, frozenset())
+
   for setting in resize_arguments_group:
-    if setting.name in ['object_to_resize', 'resize_mode', 'set_fill_color', 'fill_color']:
+    if setting.name in _SETTING_NAMES_WITH_VISIBILITY_INDEPENDENT_OF_RESIZE_MODE:
       continue
 
-    setting.gui.set_visible(False)
-
-  if resize_mode_setting.value == ResizeModes.RESIZE_FROM_EDGES:
-    resize_arguments_group['resize_from_edges_same_amount_for_each_side'].gui.set_visible(True)
-  elif resize_mode_setting.value == ResizeModes.RESIZE_FROM_POSITION:
-    resize_arguments_group['resize_from_position_anchor'].gui.set_visible(True)
-    resize_arguments_group['resize_from_position_width'].gui.set_visible(True)
-    resize_arguments_group['resize_from_position_height'].gui.set_visible(True)
-  elif resize_mode_setting.value == ResizeModes.RESIZE_TO_ASPECT_RATIO:
-    resize_arguments_group['resize_to_aspect_ratio_ratio'].gui.set_visible(True)
-    resize_arguments_group['resize_to_aspect_ratio_position'].gui.set_visible(True)
-  elif resize_mode_setting.value == ResizeModes.RESIZE_TO_AREA:
-    resize_arguments_group['resize_to_area_x'].gui.set_visible(True)
-    resize_arguments_group['resize_to_area_y'].gui.set_visible(True)
-    resize_arguments_group['resize_to_area_width'].gui.set_visible(True)
-    resize_arguments_group['resize_to_area_height'].gui.set_visible(True)
-  elif resize_mode_setting.value == ResizeModes.RESIZE_TO_LAYER_SIZE:
-    resize_arguments_group['resize_to_layer_size_layers'].gui.set_visible(True)
-  elif resize_mode_setting.value == ResizeModes.RESIZE_TO_IMAGE_SIZE:
-    resize_arguments_group['resize_to_image_size_image'].gui.set_visible(True)
+    setting.gui.set_visible(setting.name in visible_setting_names)
+
+  # Settings whose visibility depends on other settings may have been hidden in
+  # the loop above after being shown by their event handlers, hence updating
+  # them last.
+  _set_visible_for_resize_from_edges_settings(
+    resize_arguments_group['resize_from_edges_same_amount_for_each_side'],
+    resize_arguments_group,
+  )
+  _set_visible_for_resize_to_aspect_ratio_position_custom(
+    resize_arguments_group['resize_to_aspect_ratio_position'],
+    resize_arguments_group['resize_to_aspect_ratio_position_custom'],
+  )
+
+
+_SETTING_NAMES_WITH_VISIBILITY_INDEPENDENT_OF_RESIZE_MODE = frozenset([
+  'object_to_resize',
+  'resize_mode',
+  'set_fill_color',
+  'fill_color',
+])
+
+_VISIBLE_SETTING_NAMES_PER_RESIZE_MODE = {
+  ResizeModes.RESIZE_FROM_EDGES: frozenset([
+    'resize_from_edges_same_amount_for_each_side',
+  ]),
+  ResizeModes.RESIZE_FROM_POSITION: frozenset([
+    'resize_from_position_anchor',
+    'resize_from_position_width',
+    'resize_from_position_height',
+  ]),
+  ResizeModes.RESIZE_TO_ASPECT_RATIO: frozenset([
+    'resize_to_aspect_ratio_ratio',
+    'resize_to_aspect_ratio_position',
+  ]),
+  ResizeModes.RESIZE_TO_AREA: frozenset([
+    'resize_to_area_x',
+    'resize_to_area_y',
+    'resize_to_area_width',
+    'resize_to_area_height',
+  ]),
+  ResizeModes.RESIZE_TO_LAYER_SIZE: frozenset([
+    'resize_to_layer_size_layers',
+  ]),
+  ResizeModes.RESIZE_TO_IMAGE_SIZE: frozenset([
+    'resize_to_image_size_image',
+  ]),
+}
 
 
 def _set_display_name_for_resize_canvas(resize_mode_setting, action):
@@ -552,6 +619,59 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
       resize_mode_setting.items_display_names[resize_mode_setting.value])
 
 
+# Each entry contains a path to a setting within an action, the events to
+# connect, the event handler and a path to the setting passed to the handler.
+_RESIZE_CANVAS_EVENT_BINDINGS = (
+  (
+    'arguments/resize_from_edges_same_amount_for_each_side',
+    ('value-changed', 'gui-visible-changed'),
+    _set_visible_for_resize_from_edges_settings,
+    'arguments',
+  ),
+  (
+    'arguments/resize_to_aspect_ratio_position',
+    ('value-changed', 'gui-visible-changed'),
+    _set_visible_for_resize_to_aspect_ratio_position_custom,
+    'arguments/resize_to_aspect_ratio_position_custom',
+  ),
+  (
+    'arguments/set_fill_color',
+    ('value-changed',),
+    _set_visible_for_fill_color,
+    'arguments/fill_color',
+  ),
+  (
+    'arguments/resize_mode',
+    ('value-changed',),
+    _set_visible_for_resize_mode_settings,
+    'arguments',
+  ),
+)
+
+
+def _get_zero_pixels_dimension_default_value(percent_property):
+  return _get_dimension_default_value(0.0, 0.0, 0.0, Gimp.Unit.pixel(), percent_property)
+
+
+def _get_full_percent_dimension_default_value(percent_property):
+  return _get_dimension_default_value(100.0, 100.0, 1.0, Gimp.Unit.percent(), percent_property)
+
+
+def _get_dimension_default_value(
+      pixel_value, percent_value, other_value, unit, percent_property):
+  return {
+    'pixel_value': pixel_value,
+    'percent_value': percent_value,
+    'other_value': other_value,
+    'unit': unit,
+    'percent_object': 'current_image',
+    'percent_property': {
+      placeholders_.ALL_IMAGE_PLACEHOLDERS: percent_property,
+      placeholders_.ALL_LAYER_PLACEHOLDERS: percent_property,
+    },
+  }
+
+
 RESIZE_CANVAS_DICT = {
   'name': 'resize_canvas',
   'function': resize_canvas,
@@ -602,17 +722,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_from_edges_amount',
-      'default_value': {
-        'pixel_value': 0.0,
-        'percent_value': 0.0,
-        'other_value': 0.0,
-        'unit': Gimp.Unit.pixel(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'width',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'width',
-        },
-      },
+      'default_value': _get_zero_pixels_dimension_default_value('width'),
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
         *placeholders_.ALL_LAYER_PLACEHOLDERS,
@@ -622,17 +732,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_from_edges_top',
-      'default_value': {
-        'pixel_value': 0.0,
-        'percent_value': 0.0,
-        'other_value': 0.0,
-        'unit': Gimp.Unit.pixel(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'height',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'height',
-        },
-      },
+      'default_value': _get_zero_pixels_dimension_default_value('height'),
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
         *placeholders_.ALL_LAYER_PLACEHOLDERS,
@@ -642,17 +742,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_from_edges_bottom',
-      'default_value': {
-        'pixel_value': 0.0,
-        'percent_value': 0.0,
-        'other_value': 0.0,
-        'unit': Gimp.Unit.pixel(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'height',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'height',
-        },
-      },
+      'default_value': _get_zero_pixels_dimension_default_value('height'),
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
         *placeholders_.ALL_LAYER_PLACEHOLDERS,
@@ -662,17 +752,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_from_edges_left',
-      'default_value': {
-        'pixel_value': 0.0,
-        'percent_value': 0.0,
-        'other_value': 0.0,
-        'unit': Gimp.Unit.pixel(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'width',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'width',
-        },
-      },
+      'default_value': _get_zero_pixels_dimension_default_value('width'),
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
         *placeholders_.ALL_LAYER_PLACEHOLDERS,
@@ -682,17 +762,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_from_edges_right',
-      'default_value': {
-        'pixel_value': 0.0,
-        'percent_value': 0.0,
-        'other_value': 0.0,
-        'unit': Gimp.Unit.pixel(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'width',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'width',
-        },
-      },
+      'default_value': _get_zero_pixels_dimension_default_value('width'),
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
         *placeholders_.ALL_LAYER_PLACEHOLDERS,
@@ -709,17 +779,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_from_position_width',
-      'default_value': {
-        'pixel_value': 100.0,
-        'percent_value': 100.0,
-        'other_value': 1.0,
-        'unit': Gimp.Unit.percent(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'width',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'width',
-        },
-      },
+      'default_value': _get_full_percent_dimension_default_value('width'),
       'min_value': 0.0,
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
@@ -730,17 +790,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_from_position_height',
-      'default_value': {
-        'pixel_value': 100.0,
-        'percent_value': 100.0,
-        'other_value': 1.0,
-        'unit': Gimp.Unit.percent(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'height',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'height',
-        },
-      },
+      'default_value': _get_full_percent_dimension_default_value('height'),
       'min_value': 0.0,
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
@@ -774,17 +824,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_to_aspect_ratio_position_custom',
-      'default_value': {
-        'pixel_value': 0.0,
-        'percent_value': 0.0,
-        'other_value': 0.0,
-        'unit': Gimp.Unit.pixel(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'width',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'width',
-        },
-      },
+      'default_value': _get_zero_pixels_dimension_default_value('width'),
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
         *placeholders_.ALL_LAYER_PLACEHOLDERS,
@@ -794,17 +834,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_to_area_x',
-      'default_value': {
-        'pixel_value': 0.0,
-        'percent_value': 0.0,
-        'other_value': 0.0,
-        'unit': Gimp.Unit.pixel(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'width',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'width',
-        },
-      },
+      'default_value': _get_zero_pixels_dimension_default_value('width'),
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
         *placeholders_.ALL_LAYER_PLACEHOLDERS,
@@ -814,17 +844,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_to_area_y',
-      'default_value': {
-        'pixel_value': 0.0,
-        'percent_value': 0.0,
-        'other_value': 0.0,
-        'unit': Gimp.Unit.pixel(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'height',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'height',
-        },
-      },
+      'default_value': _get_zero_pixels_dimension_default_value('height'),
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
         *placeholders_.ALL_LAYER_PLACEHOLDERS,
@@ -834,17 +854,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_to_area_width',
-      'default_value': {
-        'pixel_value': 100.0,
-        'percent_value': 100.0,
-        'other_value': 1.0,
-        'unit': Gimp.Unit.percent(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'width',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'width',
-        },
-      },
+      'default_value': _get_full_percent_dimension_default_value('width'),
       'min_value': 0.0,
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
@@ -855,17 +865,7 @@ def _set_display_name_for_resize_canvas(resize_mode_setting, action):
     {
       'type': 'dimension',
       'name': 'resize_to_area_height',
-      'default_value': {
-        'pixel_value': 100.0,
-        'percent_value': 100.0,
-        'other_value': 1.0,
-        'unit': Gimp.Unit.percent(),
-        'percent_object': 'current_image',
-        'percent_property': {
-          placeholders_.ALL_IMAGE_PLACEHOLDERS: 'height',
-          placeholders_.ALL_LAYER_PLACEHOLDERS: 'height',
-        },
-      },
+      'default_value': _get_full_percent_dimension_default_value('height'),
       'min_value': 0.0,
       'percent_placeholder_names': [
         *placeholders_.ALL_IMAGE_PLACEHOLDERS,
@@ -31,6 +31,7 @@
   'set_item_export_name',
   'get_item_filepath',
   'unit_to_pixels',
+  'units_to_pixels',
   'angle_to_radians',
   'add_color_layer',
   'get_best_matching_layer_from_image',
@@ -165,11 +166,8 @@ def get_item_filepath(item, directory: Union[Gio.File, str, None]) -> str:
 
   dirpath = os.path.abspath(dirpath)
 
-  path_components = [get_item_export_name(parent) for parent in item.parents]
-  if path_components:
-    dirpath = os.path.join(dirpath, os.path.join(*path_components))
-
-  return os.path.join(dirpath, get_item_export_name(item))
+  return os.path.join(
+    dirpath, *map(get_item_export_name, item.parents), get_item_export_name(item))
 
 
 def unit_to_pixels(batcher, dimension, resolution_axis):
@@ -181,7 +179,46 @@ def unit_to_pixels(batcher, dimension, resolution_axis):
   image to obtain resolution from is the currently processed image
   (`batcher.current_image`).
   """
-  if dimension['unit'] == Gimp.Unit.percent():
+  return _unit_to_pixels(batcher, dimension, resolution_axis, {})
+
+
+def units_to_pixels(batcher, dimensions_and_resolution_axes):
+  """Converts multiple values of `setting_additional.DimensionSetting` to
+  pixels.
+
+  ``dimensions_and_resolution_axes`` is an iterable of
+  ``(dimension, resolution_axis)`` pairs. The result is a list of pixel values
+  in the same order, equal to calling `unit_to_pixels()` for each pair.
+  Dimensions of objects that percentages are relative to and the image
+  resolution are obtained only once for all pairs.
+  """
+  cache = {}
+
+  return [
+    _unit_to_pixels(batcher, dimension, resolution_axis, cache)
+    for dimension, resolution_axis in dimensions_and_resolution_axes
+  ]
+
+
+_UNIT_PERCENT = Gimp.Unit.percent()
+_UNIT_PIXEL = Gimp.Unit.pixel()
+
+# Factors of built-in units never change, unlike those of user-defined units.
+_BUILT_IN_UNIT_FACTORS = {
+  unit: unit.get_factor()
+  for unit in [Gimp.Unit.inch(), Gimp.Unit.mm(), Gimp.Unit.pica(), Gimp.Unit.point()]
+}
+
+
+def _unit_to_pixels(batcher, dimension, resolution_axis, cache):
+  unit = dimension['unit']
+
+  # Pixels are the most common unit, hence checking them first.
+  if unit == _UNIT_PIXEL:
+    pixel_value = dimension['pixel_value']
+    return pixel_value if isinstance(pixel_value, int) else round(pixel_value)
+
+  if unit == _UNIT_PERCENT:
     if isinstance(dimension['percent_object'], dict):
       percent_object_name = dimension['percent_object']['name']
       percent_object_kwargs = {
@@ -190,34 +227,33 @@ def unit_to_pixels(batcher, dimension, resolution_axis):
       percent_object_name = dimension['percent_object']
       percent_object_kwargs = {}
 
-    placeholder_object = placeholders_.PLACEHOLDERS[percent_object_name]
-    gimp_object = placeholder_object.replace_args(None, batcher, **percent_object_kwargs)
-
     percent_property = _get_percent_property_value(
       dimension['percent_property'], percent_object_name)
 
-    if percent_property == 'width':
-      gimp_object_dimension = gimp_object.get_width()
-    elif percent_property == 'height':
-      gimp_object_dimension = gimp_object.get_height()
-    elif percent_property == 'x_offset':
-      if isinstance(gimp_object, Gimp.Image):
-        gimp_object_dimension = 0
-      else:
-        gimp_object_dimension = gimp_object.get_offsets().offset_x
-    elif percent_property == 'y_offset':
-      if isinstance(gimp_object, Gimp.Image):
-        gimp_object_dimension = 0
-      else:
-        gimp_object_dimension = gimp_object.get_offsets().offset_y
+    # Objects obtained with additional arguments are not cached as the
+    # arguments may not be hashable.
+    if not percent_object_kwargs:
+      cache_key = (percent_object_name, percent_property)
+    else:
+      cache_key = None
+
+    if cache_key is not None and cache_key in cache:
+      gimp_object_dimension = cache[cache_key]
     else:
-      raise ValueError(f'unrecognized percent property: {percent_property}')
+      placeholder_object = placeholders_.PLACEHOLDERS[percent_object_name]
+      gimp_object = placeholder_object.replace_args(None, batcher, **percent_object_kwargs)
+
+      gimp_object_dimension = _get_object_dimension(gimp_object, percent_property)
+
+      if cache_key is not None:
+        cache[cache_key] = gimp_object_dimension
 
     pixels = (dimension['percent_value'] / 100) * gimp_object_dimension
-  elif dimension['unit'] == Gimp.Unit.pixel():
-    pixels = dimension['pixel_value']
   else:
-    image_resolution = batcher.current_image.get_resolution()
+    if 'resolution' not in cache:
+      cache['resolution'] = batcher.current_image.get_resolution()
+
+    image_resolution = cache['resolution']
     if resolution_axis == 'x':
       image_resolution_for_axis = image_resolution.xresolution
     elif resolution_axis == 'y':
@@ -225,14 +261,48 @@ def unit_to_pixels(batcher, dimension, resolution_axis):
     else:
       raise ValueError(f'unrecognized value for resolution_axis: {resolution_axis}')
 
-    pixels = (
-      dimension['other_value'] / dimension['unit'].get_factor() * image_resolution_for_axis)
+    unit_factor = _BUILT_IN_UNIT_FACTORS.get(unit)
+    if unit_factor is None:
+      unit_factor = unit.get_factor()
+
+    pixels = dimension['other_value'] / unit_factor * image_resolution_for_axis
 
   int_pixels = round(pixels)
 
   return int_pixels
 
 
+def _get_object_dimension(gimp_object, percent_property):
+  try:
+    get_dimension_func = _GET_OBJECT_DIMENSION_FUNCS[percent_property]
+  except KeyError:
+    raise ValueError(f'unrecognized percent property: {percent_property}')
+
+  return get_dimension_func(gimp_object)
+
+
+def _get_object_x_offset(gimp_object):
+  if isinstance(gimp_object, Gimp.Image):
+    return 0
+  else:
+    return gimp_object.get_offsets().offset_x
+
+
+def _get_object_y_offset(gimp_object):
+  if isinstance(gimp_object, Gimp.Image):
+    return 0
+  else:
+    return gimp_object.get_offsets().offset_y
+
+
+_GET_OBJECT_DIMENSION_FUNCS = {
+  'width': lambda gimp_object: gimp_object.get_width(),
+  'height': lambda gimp_object: gimp_object.get_height(),
+  'x_offset': _get_object_x_offset,
+  'y_offset': _get_object_y_offset,
+}
+
+
 def _get_percent_property_value(percent_property, percent_object):
   """Returns the property (e.g. width, X-offset) for the current value of
   ``'percent_object'`` within the `DimensionSetting` value's
@@ -267,10 +337,19 @@ def add_color_layer(
       selection_width,
       selection_height,
 ):
+  if (selection_x <= 0
+      and selection_y <= 0
+      and selection_x + selection_width >= image.get_width()
+      and selection_y + selection_height >= image.get_height()):
+    # The selection covers the entire image, hence the inverted selection below
+    # would be empty and nothing would be filled.
+    return
+
+  color = setting_.ColorSetting.get_value_as_color(padding_color)
+
   Gimp.context_push()
-  Gimp.context_set_foreground(setting_.ColorSetting.get_value_as_color(padding_color))
-  Gimp.context_set_opacity(
-    setting_.ColorSetting.get_value_as_color(padding_color).get_rgba().alpha * 100)
+  Gimp.context_set_foreground(color)
+  Gimp.context_set_opacity(color.get_rgba().alpha * 100)
 
   channel = pdb.gimp_selection_save(image=image)
   image.select_rectangle(
@@ -318,7 +397,7 @@ def get_best_matching_layer_from_image(batcher, image):
 
   selected_layers = image.get_selected_layers()
   if selected_layers:
-    return image.get_selected_layers()[0]
+    return selected_layers[0]
   else:
     layers = image.get_layers()
     if layers:
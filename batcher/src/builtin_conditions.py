@@ -158,6 +158,19 @@ class MatchModes:
   )
 
 
+# key: match mode; value: (display name with text, display name without text)
+_MATCHING_TEXT_DISPLAY_NAMES = {
+  MatchModes.STARTS_WITH: (_('Starting with "{}"'), _('Starting with Any Text')),
+  MatchModes.DOES_NOT_START_WITH: (
+    _('Not Starting with "{}"'), _('Not Starting with Any Text')),
+  MatchModes.CONTAINS: (_('Containing "{}"'), _('Containing Any Text')),
+  MatchModes.DOES_NOT_CONTAIN: (_('Not Containing "{}"'), _('Not Containing Any Text')),
+  MatchModes.ENDS_WITH: (_('Ending with "{}"'), _('Ending with Any Text')),
+  MatchModes.DOES_NOT_END_WITH: (_('Not Ending with "{}"'), _('Not Ending with Any Text')),
+  MatchModes.REGEX: (_('Matching Pattern "{}"'), _('Matching Pattern "{}"').format('')),
+}
+
+
 def _on_after_add_without_color_tag_condition(
       _conditions,
       condition,
@@ -174,30 +187,34 @@ def _on_after_add_matching_text_condition(
       _orig_condition_dict,
       _settings,
 ):
+  match_mode_setting = condition['arguments/match_mode']
+  text_setting = condition['arguments/text']
+  ignore_case_sensitivity_setting = condition['arguments/ignore_case_sensitivity']
+
   builtin_commands_common.set_up_display_name_change_for_command(
     _set_display_name_for_matching_text,
-    condition['arguments/match_mode'],
+    match_mode_setting,
     condition,
     [
-      condition['arguments/text'],
-      condition['arguments/ignore_case_sensitivity'],
+      text_setting,
+      ignore_case_sensitivity_setting,
     ],
   )
 
-  condition['arguments/text'].connect_event(
+  text_setting.connect_event(
     'value-changed',
     _set_display_name_for_matching_text_via_text,
     condition,
-    condition['arguments/match_mode'],
-    condition['arguments/ignore_case_sensitivity'],
+    match_mode_setting,
+    ignore_case_sensitivity_setting,
   )
 
-  condition['arguments/ignore_case_sensitivity'].connect_event(
+  ignore_case_sensitivity_setting.connect_event(
     'value-changed',
     _set_display_name_for_matching_text_via_ignore_case_sensitivity,
     condition,
-    condition['arguments/match_mode'],
-    condition['arguments/text'],
+    match_mode_setting,
+    text_setting,
   )
 
 
@@ -207,42 +224,16 @@ def _set_display_name_for_matching_text(
       text_setting,
       ignore_case_sensitivity_setting,
 ):
-  display_name = None
+  display_names = _MATCHING_TEXT_DISPLAY_NAMES.get(match_mode_setting.value)
+
+  if display_names is not None:
+    display_name_with_text, display_name_without_text = display_names
 
-  if match_mode_setting.value == MatchModes.STARTS_WITH:
-    if text_setting.value:
-      display_name = _('Starting with "{}"').format(text_setting.value)
-    else:
-      display_name = _('Starting with Any Text')
-  elif match_mode_setting.value == MatchModes.DOES_NOT_START_WITH:
-    if text_setting.value:
-      display_name = _('Not Starting with "{}"').format(text_setting.value)
-    else:
-      display_name = _('Not Starting with Any Text')
-  elif match_mode_setting.value == MatchModes.CONTAINS:
-    if text_setting.value:
-      display_name = _('Containing "{}"').format(text_setting.value)
-    else:
-      display_name = _('Containing Any Text')
-  elif match_mode_setting.value == MatchModes.DOES_NOT_CONTAIN:
-    if text_setting.value:
-      display_name = _('Not Containing "{}"').format(text_setting.value)
-    else:
-      display_name = _('Not Containing Any Text')
-  elif match_mode_setting.value == MatchModes.ENDS_WITH:
-    if text_setting.value:
-      display_name = _('Ending with "{}"').format(text_setting.value)
-    else:
-      display_name = _('Ending with Any Text')
-  elif match_mode_setting.value == MatchModes.DOES_NOT_END_WITH:
     if text_setting.value:
-      display_name = _('Not Ending with "{}"').format(text_setting.value)
+      display_name = display_name_with_text.format(text_setting.value)
     else:
-      display_name = _('Not Ending with Any Text')
-  elif match_mode_setting.value == MatchModes.REGEX:
-    display_name = _('Matching Pattern "{}"').format(text_setting.value)
+      display_name = display_name_without_text
 
-  if display_name is not None:
     if ignore_case_sensitivity_setting.value:
       # FOR TRANSLATORS: Think of "case-insensitive matching" when translating this
       display_name += _(' (Case-Insensitive)')
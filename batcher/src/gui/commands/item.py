@@ -25,9 +25,14 @@ def __init__(self, command, attach_editor_widget=True):
     self._command = command
     self._attach_editor_widget = attach_editor_widget
 
+    # The original name is set when a command is created and never changes
+    # afterwards.
+    self._orig_name = self._command['orig_name'].value
+
     self._display_warning_message_event_id = None
     self._display_info_message_event_id = None
     self._drag_icon_window = None
+    self._drag_icon_button = None
 
     self._button_command = self._command['enabled'].gui.widget
 
@@ -39,21 +44,27 @@ def __init__(self, command, attach_editor_widget=True):
     self._init_gui()
 
     self._button_edit.connect('clicked', self._on_button_edit_clicked)
-    self._button_remove.connect('clicked', lambda *args: self.editor.destroy())
+    self._button_remove.connect('clicked', self._on_button_remove_clicked)
 
     if self._command['display_options_on_create'].value:
       self._command['display_options_on_create'].set_value(False)
       self.widget.connect('realize', lambda *args: self.editor.show_all())
 
-    self.editor.connect('close', self._on_command_edit_dialog_close)
-    self.editor.connect('response', self._on_command_edit_dialog_response)
-
   @property
   def command(self):
     return self._command
 
+  @property
+  def orig_name(self) -> str:
+    return self._orig_name
+
   @property
   def editor(self):
+    # The editor is created on first access as most commands are usually not
+    # edited during a session.
+    if self._editor is None:
+      self._create_editor()
+
     return self._editor
 
   @property
@@ -65,7 +76,11 @@ def button_edit(self) -> Gtk.Button:
     return self._button_edit
 
   def is_being_edited(self):
-    return self.editor.get_mapped()
+    return self._editor is not None and self._editor.get_mapped()
+
+  def hide_editor(self):
+    if self._editor is not None:
+      self._editor.hide()
 
   def set_tooltip(self, additional_text=None):
     if self._command['description'].value:
@@ -85,6 +100,10 @@ def reset_tooltip(self):
     self.set_tooltip()
 
   def set_warning(self, show, main_message=None, failure_message=None, details=None, parent=None):
+    if not show and self._display_warning_message_event_id is None:
+      # The warning is not displayed, there is nothing to reset.
+      return
+
     if show:
       self.set_tooltip(failure_message)
 
@@ -106,6 +125,9 @@ def set_warning(self, show, main_message=None, failure_message=None, details=Non
         self._display_warning_message_event_id = None
 
   def set_info(self, show, message=None):
+    if not show and self._display_info_message_event_id is None:
+      return
+
     if show:
       self.set_tooltip(message)
 
@@ -126,34 +148,22 @@ def set_info(self, show, message=None):
         self._display_info_message_event_id = None
 
   def create_drag_icon(self):
-    if self._drag_icon_window is not None:
-      # We do not destroy the widget on "drag-end" so that an animation
-      # indicating failed dragging is played.
+    screen = self.widget.get_screen()
+
+    if self._drag_icon_window is not None and self._drag_icon_window.get_screen() != screen:
       self._drag_icon_window.destroy()
       self._drag_icon_window = None
 
-    button = Gtk.CheckButton(label=self._command['display_name'].value)
-    button.get_child().set_xalign(0.0)
-    button.get_child().set_yalign(0.5)
-    button.get_child().set_ellipsize(Pango.EllipsizeMode.END)
-    button.get_child().set_can_focus(False)
+    # The drag icon is created once and then reused. We do not destroy the
+    # widget on "drag-end" so that an animation indicating failed dragging is
+    # played.
+    if self._drag_icon_window is None:
+      self._create_drag_icon_window(screen)
 
-    button.set_border_width(self._DRAG_ICON_BORDER_WIDTH)
-    button.set_can_focus(False)
-
-    button.set_active(self._command['enabled'].value)
-
-    frame = Gtk.Frame(shadow_type=Gtk.ShadowType.OUT)
-    frame.add(button)
+    self._drag_icon_button.get_child().set_text(self._command['display_name'].value)
+    self._drag_icon_button.set_active(self._command['enabled'].value)
 
-    self._drag_icon_window = Gtk.Window(
-      type=Gtk.WindowType.POPUP,
-      screen=self.widget.get_screen(),
-      width_request=self._DRAG_ICON_WIDTH,
-      attached_to=self.widget,
-      transient_for=gui_utils_.get_toplevel_window(self.widget),
-    )
-    self._drag_icon_window.add(frame)
+    self._drag_icon_window.set_transient_for(gui_utils_.get_toplevel_window(self.widget))
     self._drag_icon_window.show_all()
 
     return self._drag_icon_window
@@ -162,20 +172,16 @@ def prepare_command_for_detachment(self):
     self._command['enabled'].remove_event(self._on_command_enabled_changed_event_id)
 
   def _init_gui(self):
-    self._label_command_name = self._command['display_name'].gui.widget.get_child()
+    display_name_setting = self._command['display_name']
+
+    self._label_command_name = display_name_setting.gui.widget.get_child()
     self._label_command_name.set_ellipsize(Pango.EllipsizeMode.END)
     self._label_command_name.set_max_width_chars(self._LABEL_COMMAND_NAME_MAX_WIDTH_CHARS)
 
     self._button_edit = self._setup_item_button(icon=GimpUi.ICON_EDIT, position=0)
     self._button_edit.set_tooltip_text(_('Edit'))
 
-    self._editor = command_editor_.CommandEditor(
-      self._command,
-      self.widget,
-      attach_editor_widget=self._attach_editor_widget,
-      title=self._command['display_name'].value,
-      attached_to=self.widget,
-    )
+    self._editor = None
     self.widget.connect('realize', self._on_command_widget_realize)
 
     self._button_remove.set_tooltip_text(_('Remove'))
@@ -191,8 +197,45 @@ def _init_gui(self):
 
     self.set_tooltip()
 
+  def _create_editor(self):
+    self._editor = command_editor_.CommandEditor(
+      self._command,
+      self.widget,
+      attach_editor_widget=self._attach_editor_widget,
+      title=self._command['display_name'].value,
+      attached_to=self.widget,
+    )
+
+    self._editor.connect('close', self._on_command_edit_dialog_close)
+    self._editor.connect('response', self._on_command_edit_dialog_response)
+
+    if self.widget.get_realized():
+      self._editor.set_transient_for(gui_utils_.get_toplevel_window(self.widget))
+
+  def _create_drag_icon_window(self, screen):
+    self._drag_icon_button = Gtk.CheckButton(label='')
+    self._drag_icon_button.get_child().set_xalign(0.0)
+    self._drag_icon_button.get_child().set_yalign(0.5)
+    self._drag_icon_button.get_child().set_ellipsize(Pango.EllipsizeMode.END)
+    self._drag_icon_button.get_child().set_can_focus(False)
+
+    self._drag_icon_button.set_border_width(self._DRAG_ICON_BORDER_WIDTH)
+    self._drag_icon_button.set_can_focus(False)
+
+    frame = Gtk.Frame(shadow_type=Gtk.ShadowType.OUT)
+    frame.add(self._drag_icon_button)
+
+    self._drag_icon_window = Gtk.Window(
+      type=Gtk.WindowType.POPUP,
+      screen=screen,
+      width_request=self._DRAG_ICON_WIDTH,
+      attached_to=self.widget,
+    )
+    self._drag_icon_window.add(frame)
+
   def _on_command_widget_realize(self, _dialog):
-    self.editor.set_transient_for(gui_utils_.get_toplevel_window(self.widget))
+    if self._editor is not None:
+      self._editor.set_transient_for(gui_utils_.get_toplevel_window(self.widget))
 
   def _on_button_edit_clicked(self, _button):
     if self.is_being_edited():
@@ -200,6 +243,10 @@ def _on_button_edit_clicked(self, _button):
     else:
       self.editor.show_all()
 
+  def _on_button_remove_clicked(self, _button):
+    if self._editor is not None:
+      self._editor.destroy()
+
   @staticmethod
   def _on_button_warning_clicked(_button, main_message, short_message, full_message, parent):
     gui_messages_.display_failure_message(main_message, short_message, full_message, parent=parent)
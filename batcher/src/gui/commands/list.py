@@ -108,6 +108,9 @@ def __init__(
     self._current_temporary_command = None
     self._current_temporary_command_item = None
 
+    # key: command name; value: `command_item_.CommandItem`
+    self._items_by_command_name = {}
+
     self._init_gui()
 
     if self._browser is not None:
@@ -147,6 +150,9 @@ def browser(self):
   def button_add(self):
     return self._button_add
 
+  def get_item(self, command_name: str) -> Optional[command_item_.CommandItem]:
+    return self._items_by_command_name.get(command_name, None)
+
   def add_item(
         self,
         command_dict_or_pdb_proc_name_or_command: Union[Dict[str, Any], str, setting_.Group],
@@ -264,14 +270,14 @@ def _add_item_from_command(self, command, attach_editor_widget=True):
 
     super().add_item(item)
 
+    self._items_by_command_name[command.name] = item
+
     self.emit('command-list-item-added', item)
 
     return item
 
   def _reorder_command(self, command, new_position):
-    item = next(
-      (item_ for item_ in self._items if item_.command.name == command.name),
-      None)
+    item = self.get_item(command.name)
     if item is not None:
       self._reorder_item(item, new_position)
     else:
@@ -282,9 +288,7 @@ def _reorder_item(self, item, new_position):
     return super().reorder_item(item, new_position)
 
   def _remove_command(self, command):
-    item = next(
-      (item_ for item_ in self._items if item_.command.name == command.name),
-      None)
+    item = self.get_item(command.name)
 
     if item is not None:
       self._remove_item(item)
@@ -300,6 +304,8 @@ def _remove_item(self, item):
 
     super().remove_item(item)
 
+    self._items_by_command_name.pop(item.command.name, None)
+
   def _clear(self):
     for _unused in range(len(self._items)):
       self._remove_item(self._items[0])
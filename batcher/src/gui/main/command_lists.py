@@ -27,7 +27,8 @@ def __init__(self, settings, dialog):
     self._settings = settings
     self._dialog = dialog
 
-    self._actions_or_conditions_loaded = False
+    self._actions_loaded = False
+    self._conditions_loaded = False
 
     self._action_list = command_list_.CommandList(
       self._settings['main/actions'],
@@ -90,22 +91,28 @@ def set_command_status_and_deactivate_failed_commands(self, batcher, clear_previ
 
     for command_list, failed_commands, skipped_commands in zip(
           command_lists, failed_commands_dict, skipped_commands_dict):
+      if not failed_commands and not skipped_commands and not clear_previous:
+        continue
+
       for command_item in command_list.items:
-        if command_item.command.name in failed_commands:
+        command_name = command_item.command.name
+
+        if command_name in failed_commands:
+          item, error_message, trace = failed_commands[command_name][0][:3]
+
           command_item.set_info(False)
           command_item.set_warning(
             True,
-            messages_.get_failing_message(
-              (command_item.command, failed_commands[command_item.command.name][0][0])),
-            failed_commands[command_item.command.name][0][1],
-            failed_commands[command_item.command.name][0][2],
+            messages_.get_failing_message((command_item.command, item)),
+            error_message,
+            trace,
             parent=self._dialog,
           )
-        elif command_item.command.name in skipped_commands:
+        elif command_name in skipped_commands:
           command_item.set_warning(False)
           command_item.set_info(
             True,
-            _('Skipped: {}').format(skipped_commands[command_item.command.name][0][1])
+            _('Skipped: {}').format(skipped_commands[command_name][0][1])
           )
         else:
           if clear_previous and command_item.command['enabled'].value:
@@ -121,7 +128,7 @@ def reset_command_status(self):
   def close_command_edit_dialogs(self):
     for command_list in [self._action_list, self._condition_list]:
       for command_item in command_list.items:
-        command_item.editor.hide()
+        command_item.hide_editor()
 
   def _init_gui(self):
     self._label_actions = Gtk.Label(
@@ -186,92 +193,108 @@ def _init_setting_gui(self):
       self._condition_list,
     )
 
+    self._action_list.connect(
+      'command-list-item-removed',
+      _on_action_item_removed,
+      self._condition_list,
+    )
+
+    _set_up_existing_actions(self._action_list, self._condition_list)
+
+    self._action_list.commands.connect_event('after-load', self._on_actions_after_load)
+    self._condition_list.commands.connect_event('after-load', self._on_conditions_after_load)
+
+  def _on_actions_after_load(self, _actions):
     _set_up_existing_export_actions(self._action_list)
-    self._action_list.commands.connect_event(
-      'after-load',
-      lambda _actions: _set_up_existing_export_actions(self._action_list))
-
-    _set_up_existing_insert_overlay_and_related_commands(
-      self._action_list, self._condition_list)
-    self._action_list.commands.connect_event(
-      'after-load', self._set_up_existing_insert_overlay_and_related_commands_on_load)
-    self._condition_list.commands.connect_event(
-      'after-load', self._set_up_existing_insert_overlay_and_related_commands_on_load)
-
-  def _set_up_existing_insert_overlay_and_related_commands_on_load(self, _commands):
-    if self._actions_or_conditions_loaded:
+
+    self._actions_loaded = True
+    self._set_up_existing_insert_overlay_and_related_commands_on_load()
+
+  def _on_conditions_after_load(self, _conditions):
+    self._conditions_loaded = True
+    self._set_up_existing_insert_overlay_and_related_commands_on_load()
+
+  def _set_up_existing_insert_overlay_and_related_commands_on_load(self):
+    # The commands are set up only once both actions and conditions are loaded.
+    if self._actions_loaded and self._conditions_loaded:
       _set_up_existing_insert_overlay_and_related_commands(
         self._action_list, self._condition_list)
 
       # This allows setting up the commands again when loading again.
-      self._actions_or_conditions_loaded = False
+      self._actions_loaded = False
+      self._conditions_loaded = False
 
-    self._actions_or_conditions_loaded = True
+
+_EXPORT_ACTION_NAMES_WITHOUT_EXPORT_MODE = frozenset([
+  'export_for_edit_and_save_images',
+  'export_for_edit_layers',
+])
 
 
 def _on_action_item_added(action_list, item, settings, condition_list):
-  if item.command['orig_name'].value.startswith('export_for_'):
+  orig_name = item.orig_name
+
+  if orig_name.startswith('export_for_'):
     _handle_export_action_item_added(item)
 
-    if item.command['orig_name'].value not in [
-          'export_for_edit_and_save_images', 'export_for_edit_layers']:
+    if orig_name not in _EXPORT_ACTION_NAMES_WITHOUT_EXPORT_MODE:
       _handle_export_action_item_added_for_export_mode(item, settings)
 
-  if item.command['orig_name'].value != 'save':
+  if orig_name != 'save':
     _reorder_action_before_first_save_action(action_list, item)
 
-  if item.command['orig_name'].value.startswith('insert_overlay_for_'):
-    _handle_insert_overlay_action_item_added(action_list, item, condition_list)
+  if orig_name.startswith('insert_overlay_for_'):
+    _handle_insert_overlay_action_item_added(item, condition_list)
+
+
+def _set_up_existing_actions(
+      action_list: command_list_.CommandList,
+      condition_list: command_list_.CommandList,
+):
+  for item in action_list.items:
+    orig_name = item.orig_name
+
+    if orig_name.startswith('export_for_'):
+      _handle_export_action_item_added(item)
+    elif orig_name == 'insert_overlay_for_layers':
+      _set_up_existing_insert_overlay_action(item, condition_list)
 
 
 def _set_up_existing_export_actions(action_list: command_list_.CommandList):
   for item in action_list.items:
-    if item.command['orig_name'].value.startswith('export_for_'):
+    if item.orig_name.startswith('export_for_'):
       _handle_export_action_item_added(item)
 
 
-def _handle_insert_overlay_action_item_added(action_list, item, condition_list):
-  if item.command['orig_name'].value == 'insert_overlay_for_layers':
+def _handle_insert_overlay_action_item_added(item, condition_list):
+  if item.orig_name == 'insert_overlay_for_layers':
     if (item.command['arguments/insert_content'].value
         == builtin_actions.ContentType.LAYERS_WITH_COLOR_TAG):
-      _add_and_set_up_without_color_tag_condition(item, action_list, condition_list)
+      _add_and_set_up_without_color_tag_condition(item, condition_list)
 
-    item.command['arguments/insert_content'].connect_event(
-      'value-changed',
-      _add_or_remove_without_color_tag_condition_when_insert_content_changes,
-      item,
-      action_list,
-      condition_list,
-    )
+    _connect_insert_content_changed_event(item, condition_list)
 
 
 def _add_or_remove_without_color_tag_condition_when_insert_content_changes(
       insert_content_setting,
       item,
-      action_list,
       condition_list,
 ):
   if insert_content_setting.value == builtin_actions.ContentType.LAYERS_WITH_COLOR_TAG:
-    _add_and_set_up_without_color_tag_condition(item, action_list, condition_list)
+    _add_and_set_up_without_color_tag_condition(item, condition_list)
   else:
-    condition_name = item.command['arguments/condition_name'].value
-    if condition_name in condition_list.commands:
-      condition_item = next(
-        iter(item_ for item_ in condition_list.items if
-             item_.command.name == condition_name),
-        None)
+    condition_item = condition_list.get_item(item.command['arguments/condition_name'].value)
 
-      if condition_item is not None and condition_item in condition_list.items:
-        condition_list.remove_item(condition_item)
-        item.command['arguments/condition_name'].set_value('')
+    if condition_item is not None:
+      condition_list.remove_item(condition_item)
+      item.command['arguments/condition_name'].set_value('')
 
 
-def _add_and_set_up_without_color_tag_condition(item, action_list, condition_list):
+def _add_and_set_up_without_color_tag_condition(item, condition_list):
   condition_item = _add_without_color_tag_condition(item, condition_list)
 
   if condition_item is not None:
     _set_up_without_color_tag_condition(condition_item)
-    _set_up_insert_overlay_action(item, condition_item, action_list, condition_list)
 
     item.command['arguments/condition_name'].set_value(condition_item.command.name)
 
@@ -281,47 +304,40 @@ def _set_up_existing_insert_overlay_and_related_commands(
       condition_list: command_list_.CommandList,
 ):
   for item in action_list.items:
-    if item.command['orig_name'].value != 'insert_overlay_for_layers':
-      continue
+    if item.orig_name == 'insert_overlay_for_layers':
+      _set_up_existing_insert_overlay_action(item, condition_list)
 
-    condition_name = item.command['arguments/condition_name'].value
-    if condition_name in condition_list.commands:
-      condition_item = next(
-        iter(item_ for item_ in condition_list.items if item_.command.name == condition_name),
-        None)
-    else:
-      condition_item = None
 
-    if condition_item is not None:
-      _set_up_without_color_tag_condition(condition_item)
-      _set_up_insert_overlay_action(item, condition_item, action_list, condition_list)
+def _set_up_existing_insert_overlay_action(item, condition_list: command_list_.CommandList):
+  condition_item = condition_list.get_item(item.command['arguments/condition_name'].value)
 
-    item.command['arguments/insert_content'].connect_event(
-      'value-changed',
-      _add_or_remove_without_color_tag_condition_when_insert_content_changes,
-      item,
-      action_list,
-      condition_list,
-    )
+  if condition_item is not None:
+    _set_up_without_color_tag_condition(condition_item)
 
+  _connect_insert_content_changed_event(item, condition_list)
 
-def _set_up_insert_overlay_action(
-      item,
-      condition_item,
-      action_list: command_list_.CommandList,
-      condition_list: command_list_.CommandList,
-):
-  action_list.connect(
-    'command-list-item-removed',
-    _on_insert_overlay_action_removed,
+
+def _connect_insert_content_changed_event(item, condition_list: command_list_.CommandList):
+  insert_content_setting = item.command['arguments/insert_content']
+
+  is_connected = insert_content_setting.has_event(
+    event_type='value-changed',
+    event_handler=_add_or_remove_without_color_tag_condition_when_insert_content_changes)
+
+  # The handler may have already been connected when the item was added.
+  if is_connected:
+    return
+
+  insert_content_setting.connect_event(
+    'value-changed',
+    _add_or_remove_without_color_tag_condition_when_insert_content_changes,
     item,
     condition_list,
-    condition_item,
   )
 
 
 def _add_without_color_tag_condition(item, condition_list):
-  if item.command['orig_name'].value != 'insert_overlay_for_layers':
+  if item.orig_name != 'insert_overlay_for_layers':
     return None
 
   if item.command['arguments/condition_name'].value:
@@ -337,33 +353,33 @@ def _set_up_without_color_tag_condition(condition_item):
   _set_buttons_for_command_item_sensitive(condition_item, False)
 
 
-def _on_insert_overlay_action_removed(
-      _action_list,
-      removed_item,
-      insert_overlay_item,
-      condition_list,
-      condition_item,
-):
-  if (removed_item == insert_overlay_item
-      and condition_item is not None
-      and condition_item in condition_list.items):
-    condition_list.remove_item(condition_item)
+def _on_action_item_removed(_action_list, removed_item, condition_list):
+  # The condition tied to an insert overlay action is found via the action's
+  # arguments, so that a single handler suffices for all actions.
+  if removed_item.orig_name == 'insert_overlay_for_layers':
+    condition_item = condition_list.get_item(
+      removed_item.command['arguments/condition_name'].value)
+
+    if condition_item is not None:
+      condition_list.remove_item(condition_item)
 
 
 def _handle_export_action_item_added(item):
-  item.command['arguments/file_extension'].gui.widget.connect(
+  file_extension_setting = item.command['arguments/file_extension']
+  file_extension_entry = file_extension_setting.gui.widget
+
+  file_extension_entry.connect(
     'changed',
     lambda _entry, setting: export_settings_.apply_file_extension_gui_to_setting_if_valid(setting),
-    item.command['arguments/file_extension'])
+    file_extension_setting)
 
-  export_settings_.revert_file_extension_gui_to_last_valid_value(
-    item.command['arguments/file_extension'])
+  export_settings_.revert_file_extension_gui_to_last_valid_value(file_extension_setting)
 
-  item.command['arguments/file_extension'].gui.widget.connect(
+  file_extension_entry.connect(
     'focus-out-event',
     lambda _entry, _event, setting: (
       export_settings_.revert_file_extension_gui_to_last_valid_value(setting)),
-    item.command['arguments/file_extension'])
+    file_extension_setting)
 
   item.command['arguments/output_directory'].connect_event(
     'value-changed',
@@ -402,7 +418,7 @@ def _reorder_action_before_first_save_action(
   first_save_action_position = next(
     iter(
       index for index, item_ in enumerate(action_list.items)
-      if item_.command['orig_name'].value == 'save'),
+      if item_.orig_name == 'save'),
     None)
 
   if first_save_action_position is not None:
@@ -0,0 +1,28 @@
+import unittest
+
+import parameterized
+
+from src.builtin_actions import _resize_canvas
+
+
+class TestHalve(unittest.TestCase):
+
+  @parameterized.parameterized.expand([
+    ['zero', 0],
+    ['one', 1],
+    ['even', 10],
+    ['odd_rounded_down_to_even', 5],
+    ['odd_rounded_up_to_even', 7],
+    ['large_odd', 1001],
+    ['negative_one', -1],
+    ['negative_even', -10],
+    ['negative_odd_rounded_down_to_even', -7],
+    ['negative_odd_rounded_up_to_even', -5],
+  ])
+  def test_halve(self, _test_case_suffix, pixels):
+    self.assertEqual(_resize_canvas._halve(pixels), round(pixels / 2))
+
+  def test_halve_matches_round_for_range_of_values(self):
+    for pixels in range(-1000, 1001):
+      with self.subTest(pixels=pixels):
+        self.assertEqual(_resize_canvas._halve(pixels), round(pixels / 2))